@@ -7,15 +7,19 @@ A user-friendly GUI application for downloading TikTok videos.
 
 import sys
 
-from PySide6.QtWidgets import QApplication, QMessageBox
-
 from src.utils.tiktoksage_logger import logger
-from src.core.tiktoksage_tiktokapi import check_tiktokapi_binary, setup_tiktokapi
-from src.gui.tiktoksage_gui_main import TikTokSageApp
 
 
 def show_error_dialog(message: str) -> None:
-    """Show error dialog."""
+    """Show error dialog (printed to stderr if Qt itself cannot be loaded)."""
+    try:
+        from PySide6.QtWidgets import QApplication, QMessageBox
+    except ImportError:
+        print(f"TikTokSage error: {message}", file=sys.stderr)
+        return
+
+    # The error may have happened before the QApplication was created
+    app = QApplication.instance() or QApplication(sys.argv)  # keep a reference while the dialog runs
     error_dialog = QMessageBox()
     error_dialog.setIcon(QMessageBox.Icon.Critical)
     error_dialog.setText("Application Error")
@@ -28,6 +32,12 @@ def main() -> None:
     """Main entry point for TikTokSage."""
     try:
         logger.info("Starting TikTokSage application")
+
+        # Qt and the GUI stack are imported here rather than at module level so
+        # nothing heavy is loaded before it is actually needed
+        from PySide6.QtWidgets import QApplication
+        from src.core.tiktoksage_tiktokapi import check_tiktokapi_binary, setup_tiktokapi
+
         app = QApplication(sys.argv)
 
         # Check for TikTokApi
@@ -42,6 +52,10 @@ def main() -> None:
                 )
                 sys.exit(1)
 
+        # The main window pulls in every GUI and downloader module, so only import
+        # it once the dependency check has passed
+        from src.gui.tiktoksage_gui_main import TikTokSageApp
+
         # Create and show main window
         window = TikTokSageApp()
         window.show()
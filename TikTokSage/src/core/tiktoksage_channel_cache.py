@@ -0,0 +1,114 @@
+"""
+TikTok Channel Cache Module
+
+Persists channel listings as JSON files under APP_CHANNEL_CACHE_DIR, one file
+per channel URL, so a channel can be shown instantly the next time it is opened.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from src.utils.tiktoksage_constants import APP_CHANNEL_CACHE_DIR
+from src.utils.tiktoksage_logger import logger
+
+# Maximum number of cached channels; the least recently written ones are evicted
+CHANNEL_CACHE_MAX_ENTRIES = 2000
+
+
+def cache_path(channel_url: str) -> Path:
+    """Get the cache file used for a channel URL."""
+    digest = hashlib.sha1(channel_url.encode("utf-8")).hexdigest()
+    return APP_CHANNEL_CACHE_DIR / f"{digest}.json"
+
+
+def load_cached(channel_url: str) -> Tuple[Optional[List[dict]], float, bool]:
+    """
+    Load a cached channel listing, whatever its age.
+
+    Args:
+        channel_url: TikTok channel URL
+
+    Returns:
+        Tuple of (videos, mtime, complete): the cached video info dicts (None if
+        the channel is not cached), the time the listing was written and whether
+        it covers the whole channel
+    """
+    path = cache_path(channel_url)
+    try:
+        mtime = path.stat().st_mtime
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None, 0.0, False
+    except Exception as e:
+        logger.debug(f"Could not read channel cache {path}: {e}")
+        return None, 0.0, False
+
+    return data.get("videos") or [], mtime, bool(data.get("complete"))
+
+
+def save_cached(channel_url: str, videos: List[dict], complete: bool = True,
+                mtime: Optional[float] = None) -> None:
+    """
+    Atomically write a channel listing to the cache.
+
+    Args:
+        channel_url: TikTok channel URL
+        videos: Video info dicts to cache
+        complete: Whether the listing covers the whole channel
+        mtime: Time the listing was fetched, to keep its age when rewriting it
+            (defaults to now)
+    """
+    path = cache_path(channel_url)
+    # Per-process/thread temp name: a dialog refresh and update_channel_cache
+    # may write the same channel at the same time
+    tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"channel_url": channel_url, "complete": complete, "videos": videos},
+                f,
+                ensure_ascii=False,
+            )
+        if mtime is not None:
+            os.utime(tmp_path, (mtime, mtime))
+        os.replace(tmp_path, path)
+        logger.debug(f"Saved {len(videos)} videos to channel cache {path}")
+    except Exception as e:
+        logger.warning(f"Could not write channel cache {path}: {e}")
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        return
+
+    _evict_old_entries()
+
+
+def _evict_old_entries(max_entries: int = CHANNEL_CACHE_MAX_ENTRIES) -> None:
+    """Delete the least recently written cache files beyond max_entries."""
+    try:
+        entries = []
+        with os.scandir(APP_CHANNEL_CACHE_DIR) as it:
+            for entry in it:
+                if entry.name.endswith(".json"):
+                    entries.append((entry.stat().st_mtime, entry.path))
+    except OSError as e:
+        logger.debug(f"Could not scan channel cache: {e}")
+        return
+
+    if len(entries) <= max_entries:
+        return
+
+    entries.sort()
+    for _, path in entries[:len(entries) - max_entries]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    logger.debug(f"Evicted {len(entries) - max_entries} channel cache entries")
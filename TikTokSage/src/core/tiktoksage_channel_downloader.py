@@ -5,194 +5,881 @@ Handles downloading all videos from a TikTok channel/user.
 """
 
 import json
+import os
+import queue
+import selectors
 import subprocess
-from pathlib import Path
-from typing import List, Optional
+import threading
+import time
+from contextlib import contextmanager
+from itertools import chain
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from typing import Callable, Iterator, List, Optional, Tuple
 from signal import SIGTERM
 
-from src.utils.tiktoksage_constants import SUBPROCESS_CREATIONFLAGS
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+try:
+    import yt_dlp
+except ImportError:
+    yt_dlp = None
+
+from src.core.tiktoksage_channel_cache import load_cached, save_cached
+from src.utils.tiktoksage_constants import OS_NAME, SUBPROCESS_CREATIONFLAGS
 from src.utils.tiktoksage_logger import logger
 
+# Number of yt-dlp approaches raced against each other at the same time
+RACE_WIDTH = 3
+
+# How long all raced approaches together may take to print a first video before
+# they are terminated (seconds; the old timeout of a single approach)
+RACE_TIMEOUT = 300
+
+# Bytes requested per os.read() when draining yt-dlp pipes
+PIPE_READ_SIZE = 64 * 1024
+
+# Buffer size of the pipe file objects (used by the blocking Windows reader)
+PIPE_BUFFER_SIZE = 1024 * 1024
+
+# Fields kept from each yt-dlp video entry, with their defaults ('url' is resolved separately)
+_VIDEO_FIELDS = (
+    ('id', ''),
+    ('title', 'Unknown'),
+    ('duration', 0),
+    ('thumbnail', ''),
+    ('view_count', 0),
+    ('upload_date', ''),
+)
+
+# Compact tab-separated output: one line per video with only the fields we keep.
+# The title goes last and is JSON-encoded so tabs or newlines inside it cannot
+# break the line format.
+_PRINT_TEMPLATE = "\t".join([
+    "%(id|)s",
+    "%(webpage_url,url|)s",
+    "%(duration|0)s",
+    "%(view_count|0)s",
+    "%(upload_date|)s",
+    "%(thumbnail|)s",
+    "%(title)j",
+])
+_PRINT_OUTPUT_ARGS = ["--print", _PRINT_TEMPLATE]
+
+# Full per-video JSON documents, only needed when rich metadata is requested
+_JSON_OUTPUT_ARGS = ["--dump-json"]
+
+# How long yt-dlp may keep running after its stdout hit EOF before it is terminated (seconds)
+PROCESS_EXIT_GRACE = 2.0
+
+# Parsed videos buffered between the pipe reader thread and the consumer
+VIDEO_QUEUE_SIZE = 1024
+
+# Worker threads looking up the metadata a flat listing left out (network bound)
+ENRICH_WORKERS = 8
+
+# Options of the pooled YoutubeDL instances (listings are extracted flat; metadata
+# lookups pass process=False, which the flat extraction setting does not affect)
+_YDL_OPTS = {
+    'quiet': True,
+    'no_warnings': True,
+    'extract_flat': True,
+    'skip_download': True,
+}
+
+# Maximum number of idle YoutubeDL instances kept in the pool (see _pooled_ydl)
+YDL_POOL_SIZE = ENRICH_WORKERS
+_ydl_pool: List["yt_dlp.YoutubeDL"] = []
+_ydl_pool_lock = threading.Lock()
+
+# progress_callback is invoked at most every PROGRESS_EVERY videos or PROGRESS_INTERVAL seconds
+PROGRESS_EVERY = 25
+PROGRESS_INTERVAL = 0.1
+
+# yt-dlp command templates tried for TikTok channels, most reliable first.
+# The output format, playlist limits and channel URL are added per call.
+_APPROACHES: Tuple[Tuple[str, ...], ...] = (
+    # Approach 1: Flat playlist - lists entries from the profile pages
+    # without resolving every video, which is all we need for listing
+    (
+        "yt-dlp",
+        "--no-warnings",
+        "--skip-download",
+        "--flat-playlist",
+        "--user-agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    ),
+    # Approach 2: Standard with user-agent
+    (
+        "yt-dlp",
+        "--no-warnings",
+        "--skip-download",
+        "--user-agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    ),
+    # Approach 3: Mobile user-agent
+    (
+        "yt-dlp",
+        "--no-warnings",
+        "--skip-download",
+        "--user-agent", "Mozilla/5.0 (iPhone; CPU iPhone OS 16_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.6 Mobile/15E148 Safari/604.1",
+    ),
+    # Approach 4: With additional headers
+    (
+        "yt-dlp",
+        "--no-warnings",
+        "--skip-download",
+        "--add-header", "Referer:https://www.tiktok.com/",
+        "--add-header", "Accept-Language:en-US,en;q=0.9",
+        "--user-agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    ),
+    # Approach 5: With cookies and lazy extraction
+    (
+        "yt-dlp",
+        "--no-warnings",
+        "--skip-download",
+        "--lazy-playlist",
+        "--user-agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    ),
+)
+
+# How long a cached channel listing is served without re-running yt-dlp (seconds)
+CHANNEL_CACHE_TTL = 24 * 3600
+
+
+def _load_channel_cache(channel_url: str, max_videos: int = 0, ttl: float = CHANNEL_CACHE_TTL) -> Optional[List[dict]]:
+    """
+    Load a cached channel listing.
+
+    Args:
+        channel_url: TikTok channel URL
+        max_videos: Number of videos the caller needs (0 = the full channel)
+        ttl: Maximum age of the cache file in seconds
+
+    Returns:
+        Cached video info dicts, or None if there is no fresh cache covering the request
+    """
+    videos, mtime, complete = load_cached(channel_url)
+    if videos is None or time.time() - mtime > ttl:
+        return None
+    if not complete and (max_videos <= 0 or len(videos) < max_videos):
+        return None
+    return videos[:max_videos] if max_videos > 0 else videos
+
+
+def _to_number(raw: bytes):
+    """Convert a numeric yt-dlp template field to int/float (0 if not numeric)."""
+    try:
+        return int(raw)
+    except ValueError:
+        try:
+            return float(raw)
+        except ValueError:
+            return 0
+
+
+def _parse_print_line(line: bytes) -> Optional[dict]:
+    """
+    Parse one raw line of yt-dlp ``--print _PRINT_TEMPLATE`` output into a video info dict.
+
+    Returns:
+        Video info dict, or None if the line is not a usable video entry
+    """
+    fields = line.rstrip(b"\r\n").split(b"\t", 6)
+    if len(fields) != 7:
+        return None
+
+    video_id, url, duration, view_count, upload_date, thumbnail, title = fields
+    if not url:
+        return None
+
+    # The JSON parser decodes the title itself (straight from bytes)
+    try:
+        title = _json_loads(title) or 'Unknown'
+    except ValueError:
+        title = 'Unknown'
+
+    # Numbers are parsed from bytes directly, only text fields get decoded
+    return {
+        'id': video_id.decode("utf-8", errors="replace"),
+        'title': title,
+        'duration': _to_number(duration),
+        'thumbnail': thumbnail.decode("utf-8", errors="replace"),
+        'view_count': _to_number(view_count),
+        'upload_date': upload_date.decode("ascii", errors="replace"),
+        'url': url.decode("utf-8", errors="replace"),
+    }
+
+
+def _parse_json_line(line: bytes) -> Optional[dict]:
+    """
+    Parse one raw line of yt-dlp JSON output into a video info dict.
+
+    Returns:
+        Video info dict, or None if the line is not a usable video entry
+    """
+    line = line.strip()
+    if not line:
+        return None
+
+    try:
+        video_data = _json_loads(line)
+    except ValueError:  # json.JSONDecodeError and orjson.JSONDecodeError
+        return None
+
+    return _video_from_data(video_data) if video_data else None
+
+
+def _video_from_data(video_data: dict) -> Optional[dict]:
+    """Reduce a yt-dlp info/entry dict to a video info dict (None if it has no URL)."""
+    video_info = {key: video_data[key] if key in video_data else default for key, default in _VIDEO_FIELDS}
+    video_info['url'] = video_data.get('webpage_url') or video_data.get('url', '')
+    return video_info if video_info['url'] else None
+
+
+@contextmanager
+def _pooled_ydl() -> Iterator["yt_dlp.YoutubeDL"]:
+    """
+    Borrow a YoutubeDL instance from the shared pool (a new one if the pool is empty).
+
+    Instances are reused across channel listings and metadata lookups, so their
+    HTTP connections to TikTok (and their loaded extractors) are kept between
+    calls instead of being set up again each time. An instance is only used by
+    one thread at a time; instances beyond YDL_POOL_SIZE are closed on return.
+    """
+    with _ydl_pool_lock:
+        ydl = _ydl_pool.pop() if _ydl_pool else None
+    if ydl is None:
+        ydl = yt_dlp.YoutubeDL(_YDL_OPTS)
+    try:
+        yield ydl
+    finally:
+        with _ydl_pool_lock:
+            if len(_ydl_pool) < YDL_POOL_SIZE:
+                _ydl_pool.append(ydl)
+                ydl = None
+        if ydl is not None:
+            ydl.close()
+
+
+def _iter_native_videos(channel_url: str, cancel_event: Optional[threading.Event] = None) -> Iterator[dict]:
+    """
+    List a channel in-process through the yt_dlp library.
+
+    The playlist is extracted flat and unprocessed, so its entries are fetched
+    lazily page by page while they are iterated and no yt-dlp process has to be
+    started. Setting ``cancel_event`` stops the listing before the next entry
+    (and so before the next page request). Extraction errors propagate to the
+    caller.
+    """
+    with _pooled_ydl() as ydl:
+        info = ydl.extract_info(channel_url, download=False, process=False)
+        for entry in (info or {}).get('entries') or []:
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            video_info = _video_from_data(entry) if entry else None
+            if video_info:
+                yield video_info
+
+
+def _needs_enrichment(video_info: dict) -> bool:
+    """Whether a listed video is missing the title or duration shown in the video list."""
+    return not video_info.get('duration') or video_info.get('title') in (None, '', 'Unknown')
+
+
+def enrich_videos(videos: List[dict], video_callback: Optional[Callable[[int, dict], None]] = None,
+                  cancel_event: Optional[threading.Event] = None,
+                  max_workers: int = ENRICH_WORKERS) -> int:
+    """
+    Look up the metadata a flat channel listing left out (title, duration, ...).
+
+    Only videos missing their title or duration are looked up, each with its own
+    yt-dlp extraction on a thread pool (yt-dlp releases the GIL while waiting on
+    the network). An enriched copy replaces the entry in ``videos`` and is passed
+    to ``video_callback(index, video_info)`` as soon as its lookup finishes.
+
+    Args:
+        videos: Video info dicts as returned by get_channel_videos
+        video_callback: Callable(index, video_info) called for each enriched video
+        cancel_event: threading.Event that stops the lookups still pending when set
+        max_workers: Maximum number of concurrent lookups
+
+    Returns:
+        Number of videos that were enriched
+    """
+    pending = [index for index, video_info in enumerate(videos) if _needs_enrichment(video_info)]
+    if yt_dlp is None or not pending:
+        return 0
+
+    def fetch(index: int) -> Tuple[int, Optional[dict]]:
+        if cancel_event is not None and cancel_event.is_set():
+            return index, None
+        try:
+            with _pooled_ydl() as ydl:
+                return index, ydl.extract_info(videos[index]['url'], download=False, process=False)
+        except Exception as e:
+            logger.debug(f"Could not fetch metadata for {videos[index]['url']}: {e}")
+            return index, None
+
+    enriched = 0
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+        for future in as_completed([executor.submit(fetch, index) for index in pending]):
+            index, video_data = future.result()
+            if not video_data:
+                continue
+            # Keep the listed values where the lookup has nothing better
+            video_info = dict(videos[index])
+            for key, default in _VIDEO_FIELDS:
+                value = video_data.get(key)
+                if value and value != default:
+                    video_info[key] = value
+            videos[index] = video_info
+            enriched += 1
+            if video_callback:
+                video_callback(index, video_info)
+
+    logger.info(f"Enriched metadata of {enriched}/{len(pending)} videos")
+    return enriched
+
+
+def save_enriched_videos(channel_url: str, videos: List[dict]) -> None:
+    """
+    Write videos enriched by enrich_videos back to the cached channel listing.
+
+    Listings are cached flat, before their titles and durations are looked up;
+    merging the enriched entries in (by URL) lets the next open show them
+    without one extraction per video. The listing keeps its age and
+    completeness, and nothing is written if the channel is not cached (e.g. the
+    listing was cancelled).
+
+    Args:
+        channel_url: TikTok channel URL
+        videos: Video info dicts, enriched in place by enrich_videos
+    """
+    cached, mtime, complete = load_cached(channel_url)
+    if not cached:
+        return
+    by_url = {video.get('url'): video for video in videos}
+    merged = [by_url.get(video.get('url'), video) for video in cached]
+    save_cached(channel_url, merged, complete=complete, mtime=mtime)
+
+
+def _start_approach(base_cmd: Tuple[str, ...], channel_url: str, max_videos: int,
+                    rich_metadata: bool = False) -> subprocess.Popen:
+    """Spawn yt-dlp for one approach."""
+    output_args = _JSON_OUTPUT_ARGS if rich_metadata else _PRINT_OUTPUT_ARGS
+    cmd = [base_cmd[0], *output_args, *base_cmd[1:]]
+
+    # Stop yt-dlp from crawling further profile pages once max_videos entries are
+    # listed (--max-downloads only limits downloads, not the listing itself)
+    if max_videos > 0:
+        if "--lazy-playlist" not in cmd:
+            cmd.append("--lazy-playlist")
+        cmd.extend(["--playlist-end", str(max_videos)])
+
+    cmd.append(channel_url)
+    # Lazy: the joined command is only built when debug logging is enabled
+    logger.opt(lazy=True).debug("Command: {}", lambda: " ".join(cmd))
+
+    # Use Popen to stream output in real-time. The pipes stay binary: lines are
+    # split and parsed as bytes, so decoding all output first is wasted work.
+    return subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=PIPE_BUFFER_SIZE,
+        creationflags=SUBPROCESS_CREATIONFLAGS,
+    )
+
+
+class _ApproachRun:
+    """A running yt-dlp approach together with the reader over its output."""
+
+    def __init__(self, process: subprocess.Popen, rich_metadata: bool = False,
+                 cancel_event: Optional[threading.Event] = None):
+        self.process = process
+        self.parse_line = _parse_json_line if rich_metadata else _parse_print_line
+        self.cancel_event = cancel_event
+        self.stderr_chunks: List[bytes] = []
+        self.lines = _iter_output_lines(process, self.stderr_chunks, cancel_event)
+
+        # Windows pipes are not drained by the selector loop, so stderr gets a
+        # helper thread there; otherwise a verbose run fills the 64 KiB pipe
+        # buffer and yt-dlp blocks before writing more stdout.
+        self._stderr_thread = None
+        if OS_NAME == "Windows":
+            self._stderr_thread = threading.Thread(
+                target=_drain_pipe, args=(process.stderr, self.stderr_chunks), daemon=True
+            )
+            self._stderr_thread.start()
+
+    def cancelled(self) -> bool:
+        """Whether the caller asked to cancel the listing."""
+        return self.cancel_event is not None and self.cancel_event.is_set()
+
+    def stderr_text(self) -> str:
+        """Decode whatever yt-dlp wrote to stderr so far."""
+        if self._stderr_thread and self.process.poll() is not None:
+            self._stderr_thread.join(timeout=1)
+        return b"".join(self.stderr_chunks).decode("utf-8", errors="replace")
+
+
+def _drain_pipe(pipe, chunks: List[bytes]) -> None:
+    """Read a binary pipe until EOF, collecting its chunks."""
+    try:
+        for chunk in iter(lambda: pipe.read1(PIPE_READ_SIZE), b""):
+            chunks.append(chunk)
+    except (OSError, ValueError):  # pipe closed underneath us
+        pass
+
+
+def _iter_output_lines(process: subprocess.Popen, stderr_chunks: List[bytes],
+                       cancel_event: Optional[threading.Event] = None) -> Iterator[bytes]:
+    """
+    Yield stdout lines of a yt-dlp process as soon as the pipe has data.
+
+    On POSIX both pipes are switched to non-blocking mode and multiplexed with a
+    selector: stdout is split into lines by hand instead of waiting on Python's
+    buffered readline, and stderr is drained into ``stderr_chunks`` at the same
+    time so a full stderr pipe can never block yt-dlp from writing stdout.
+    Windows cannot select() on pipes, so there stdout is iterated directly and
+    stderr is drained by a helper thread (see _ApproachRun).
+
+    The selector wakes up at least every 50 ms, so on POSIX reading stops
+    promptly once ``cancel_event`` is set, even while yt-dlp prints nothing.
+    """
+    if OS_NAME == "Windows":
+        yield from process.stdout
+        return
+
+    selector = selectors.DefaultSelector()
+    for pipe in (process.stdout, process.stderr):
+        os.set_blocking(pipe.fileno(), False)
+        selector.register(pipe.fileno(), selectors.EVENT_READ, pipe)
+
+    pending = b""
+    try:
+        while selector.get_map():
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            for key, _ in selector.select(timeout=0.05):
+                try:
+                    chunk = os.read(key.fd, PIPE_READ_SIZE)
+                except BlockingIOError:
+                    continue
+                if not chunk:
+                    selector.unregister(key.fd)
+                elif key.data is process.stderr:
+                    stderr_chunks.append(chunk)
+                else:
+                    *lines, pending = (pending + chunk).split(b"\n")
+                    yield from lines
+        if pending:
+            yield pending
+    finally:
+        selector.close()
+
+
+def _wait_first_video(run: _ApproachRun) -> Optional[dict]:
+    """Read process output until the first valid video appears (None on EOF)."""
+    for line in run.lines:
+        video_info = run.parse_line(line)
+        if video_info:
+            return video_info
+    return None
 
-def get_channel_videos(channel_url: str, max_videos: int = 0, progress_callback=None, video_callback=None):
+
+def _stream_videos(run: _ApproachRun, first_video: dict) -> Iterator[dict]:
+    """
+    Yield the already-parsed first video, then every further video of the process.
+
+    The pipe is read and parsed on a producer thread feeding a bounded queue, so
+    yt-dlp's output keeps being drained while the consumer is busy with its
+    per-video callbacks; a full queue pushes back on the reader. Errors raised
+    while reading are re-raised in the consumer, and the stream ends early once
+    the run is cancelled.
+    """
+    yield first_video
+
+    videos = queue.Queue(maxsize=VIDEO_QUEUE_SIZE)
+    end_of_stream = object()
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        # Give up instead of blocking forever once the consumer went away
+        while not stop.is_set():
+            try:
+                videos.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for line in run.lines:
+                video_info = run.parse_line(line)
+                if video_info and not put(video_info):
+                    return
+        except Exception as e:
+            put(e)
+        put(end_of_stream)
+
+    reader = threading.Thread(target=produce, daemon=True)
+    reader.start()
+    try:
+        while not run.cancelled():
+            try:
+                item = videos.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if item is end_of_stream:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+
+
+def _stop_process(process: subprocess.Popen) -> None:
+    """Terminate a yt-dlp process and reap it."""
+    try:
+        if process.poll() is None:
+            process.terminate()
+        process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+    except Exception as e:
+        logger.debug(f"Error stopping yt-dlp process: {e}")
+
+
+def _finish_process(process: subprocess.Popen, grace: float = PROCESS_EXIT_GRACE) -> None:
+    """
+    Reap a yt-dlp process whose output has been fully read.
+
+    Once stdout hit EOF there is nothing left to wait for, so the process only
+    gets a short grace period to exit on its own before it is terminated.
+    """
+    deadline = time.monotonic() + grace
+    while process.poll() is None and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    if process.poll() is None:
+        logger.warning("yt-dlp did not exit after its output ended - terminating")
+        _stop_process(process)
+
+
+class _ProgressThrottle:
+    """Coalesce per-video progress into occasional progress_callback calls."""
+
+    def __init__(self, progress_callback, total: int):
+        self.progress_callback = progress_callback
+        self.total = total
+        self.last_count = 0
+        self.last_time = time.monotonic()
+
+    def update(self, count: int, force: bool = False) -> None:
+        """Report ``count`` videos if enough videos or time passed since the last report."""
+        if not self.progress_callback or count == self.last_count:
+            return
+        now = time.monotonic()
+        if force or count - self.last_count >= PROGRESS_EVERY or now - self.last_time > PROGRESS_INTERVAL:
+            self.progress_callback(self.total, count)
+            self.last_count = count
+            self.last_time = now
+
+
+def _race_approaches(
+    approaches: Tuple[Tuple[str, ...], ...], channel_url: str, max_videos: int, rich_metadata: bool = False,
+    cancel_event: Optional[threading.Event] = None,
+) -> Optional[Tuple[int, _ApproachRun, dict]]:
     """
-    Fetch all videos from a TikTok channel using yt-dlp with fallback options.
-    Streams videos in real-time as they are fetched.
+    Launch yt-dlp approaches concurrently and keep the first one that yields a video.
+
+    Approaches are started RACE_WIDTH at a time; as soon as one of them prints a
+    valid video the others are terminated. The whole race shares one
+    RACE_TIMEOUT deadline, so approaches that hang without printing anything
+    cost at most one timeout in total.
+
+    Returns:
+        Tuple of (approach index, running approach, first video), or None if all
+        approaches failed, the deadline passed or the race was cancelled
+    """
+    deadline = time.monotonic() + RACE_TIMEOUT
+    for batch_start in range(0, len(approaches), RACE_WIDTH):
+        if cancel_event is not None and cancel_event.is_set():
+            return None
+        if time.monotonic() >= deadline:
+            logger.warning(f"No approach listed a video within {RACE_TIMEOUT}s, giving up")
+            return None
+
+        runs = {}
+        for approach_idx in range(batch_start, min(batch_start + RACE_WIDTH, len(approaches))):
+            try:
+                logger.info(f"Trying approach {approach_idx + 1} for channel videos: {channel_url}")
+                runs[approach_idx] = _ApproachRun(
+                    _start_approach(approaches[approach_idx], channel_url, max_videos, rich_metadata),
+                    rich_metadata,
+                    cancel_event,
+                )
+            except Exception as e:
+                logger.warning(f"Approach {approach_idx + 1} error: {e}")
+
+        if not runs:
+            continue
+
+        winner = None
+        with ThreadPoolExecutor(max_workers=len(runs)) as executor:
+            pending = {
+                executor.submit(_wait_first_video, run): approach_idx
+                for approach_idx, run in runs.items()
+            }
+
+            while pending and winner is None:
+                # Wake up regularly so a cancel does not wait for the next line of output
+                done, _ = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                if cancel_event is not None and cancel_event.is_set():
+                    break
+                if not done and time.monotonic() >= deadline:
+                    break
+                for future in done:
+                    approach_idx = pending.pop(future)
+                    try:
+                        first_video = future.result()
+                    except Exception as e:
+                        logger.warning(f"Approach {approach_idx + 1} error: {e}")
+                        first_video = None
+
+                    if first_video and winner is None:
+                        winner = (approach_idx, runs[approach_idx], first_video)
+                    elif not first_video:
+                        run = runs[approach_idx]
+                        _stop_process(run.process)
+                        stderr_output = run.stderr_text()
+                        if stderr_output:
+                            logger.warning(f"Approach {approach_idx + 1} failed: {stderr_output[:200]}")
+                        else:
+                            logger.warning(f"Approach {approach_idx + 1} failed or returned no videos")
+
+            # Terminate the losers so their reader threads hit EOF and the pool can shut down
+            for approach_idx, run in runs.items():
+                if winner is None or approach_idx != winner[0]:
+                    _stop_process(run.process)
+
+        if winner:
+            return winner
+
+    return None
+
+
+def iter_channel_videos(channel_url: str, max_videos: int = 0, progress_callback=None,
+                        force_refresh: bool = False, rich_metadata: bool = False,
+                        cancel_event: Optional[threading.Event] = None, save_cache: bool = True) -> Iterator[dict]:
+    """
+    Stream the videos of a TikTok channel using yt-dlp with fallback options.
+    The channel is listed in-process with the yt_dlp library when it is available;
+    otherwise (or if that fails) the subprocess approaches are raced concurrently
+    and the first one to produce a video is streamed in real-time.
+
+    Closing the generator early, or setting ``cancel_event``, stops the running
+    yt-dlp process; a cancelled listing is not written to the channel cache.
     
     Args:
         channel_url: TikTok channel URL (e.g., https://www.tiktok.com/@username)
         max_videos: Maximum number of videos to fetch (0 = no limit)
         progress_callback: Callable(total_videos, current_progress) for progress updates
-        video_callback: Callable(video_info) called for each video as it's fetched
+        force_refresh: Ignore the on-disk channel cache and always run yt-dlp
+        rich_metadata: Parse full ``--dump-json`` documents instead of the compact
+            ``--print`` template (slower, fallback for yt-dlp builds without template support)
+        cancel_event: threading.Event that cancels the listing when set (checked
+            at least every 100 ms while waiting on yt-dlp)
+        save_cache: Write the fetched listing to the channel cache
     
     Yields:
-        Video info dicts with 'url', 'title', 'id' keys (if video_callback not provided)
-    
-    Returns:
-        List of all video info dicts
+        Video info dicts with 'url', 'title', 'id' keys as they are fetched
     """
-    videos = []
-    videos_yielded = 0
+    progress = _ProgressThrottle(progress_callback, max_videos if max_videos > 0 else 0)
     
-    try:
-        # Try different yt-dlp approaches for TikTok
-        approaches = [
-            # Approach 1: Standard with user-agent
-            [
-                "yt-dlp",
-                "--dump-json",
-                "-j",
-                "--no-warnings",
-                "--user-agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "--extract-audio",
-            ],
-            # Approach 2: Mobile user-agent
-            [
-                "yt-dlp",
-                "--dump-json", 
-                "-j",
-                "--no-warnings",
-                "--user-agent", "Mozilla/5.0 (iPhone; CPU iPhone OS 16_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.6 Mobile/15E148 Safari/604.1",
-                "--extract-audio",
-            ],
-            # Approach 3: With additional headers
-            [
-                "yt-dlp",
-                "--dump-json",
-                "-j", 
-                "--no-warnings",
-                "--add-header", "Referer:https://www.tiktok.com/",
-                "--add-header", "Accept-Language:en-US,en;q=0.9",
-                "--user-agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                "--extract-audio",
-            ],
-            # Approach 4: Without extract-audio (just metadata)
-            [
-                "yt-dlp",
-                "--dump-json",
-                "-j",
-                "--no-warnings",
-                "--flat-playlist",
-                "--user-agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            ],
-            # Approach 5: With cookies and lazy extraction
-            [
-                "yt-dlp",
-                "--dump-json",
-                "-j",
-                "--no-warnings",
-                "--lazy-playlist",
-                "--user-agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            ]
-        ]
+    # Serve a fresh cached listing without touching the network
+    cached = None if force_refresh else _load_channel_cache(channel_url, max_videos)
+    if cached is not None:
+        logger.info(f"Loaded {len(cached)} videos from cache for channel: {channel_url}")
+        for videos_yielded, video_info in enumerate(cached, 1):
+            yield video_info
+            progress.update(videos_yielded)
+        progress.update(len(cached), force=True)
+        return
+    
+    # In-process listing skips the yt-dlp startup cost of every subprocess
+    run = None
+    stream = None
+    if yt_dlp is not None and not rich_metadata:
+        try:
+            native_videos = _iter_native_videos(channel_url, cancel_event)
+            first_video = next(native_videos, None)
+            if first_video:
+                stream = chain([first_video], native_videos)
+                source = "yt-dlp library"
+        except Exception as e:
+            logger.warning(f"Native yt-dlp channel listing failed, falling back to subprocess: {e}")
+    
+    if stream is None:
+        race = _race_approaches(_APPROACHES, channel_url, max_videos, rich_metadata, cancel_event)
+        if race is None:
+            if cancel_event is not None and cancel_event.is_set():
+                logger.info(f"Channel listing cancelled: {channel_url}")
+            else:
+                logger.error("All approaches failed to fetch channel videos")
+            return
         
-        for approach_idx, base_cmd in enumerate(approaches):
-            videos = []
-            videos_yielded = 0
-            
-            try:
-                cmd = base_cmd.copy()
-                
-                # Add max downloads limit if specified
-                if max_videos > 0:
-                    cmd.extend(["--max-downloads", str(max_videos)])
-                
-                cmd.append(channel_url)
-                
-                logger.info(f"Trying approach {approach_idx + 1} for channel videos: {channel_url}")
-                logger.debug(f"Command: {' '.join(cmd)}")
-                
-                # Use Popen to stream output in real-time
-                process = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    creationflags=SUBPROCESS_CREATIONFLAGS,
-                    bufsize=1,  # Line buffered
-                    universal_newlines=True
-                )
-                
-                logger.info(f"Streaming videos from approach {approach_idx + 1}...")
-                
-                # Stream and parse output line by line
-                for line in process.stdout:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    try:
-                        video_data = json.loads(line)
-                        if video_data:
-                            video_info = {
-                                'url': video_data.get('webpage_url', video_data.get('url', '')),
-                                'title': video_data.get('title', 'Unknown'),
-                                'id': video_data.get('id', ''),
-                                'duration': video_data.get('duration', 0),
-                                'thumbnail': video_data.get('thumbnail', '')
-                            }
-                            
-                            if video_info['url']:
-                                videos.append(video_info)
-                                videos_yielded += 1
-                                
-                                # Call video callback if provided
-                                if video_callback:
-                                    video_callback(video_info)
-                                else:
-                                    yield video_info
-                                
-                                # Update progress
-                                if progress_callback:
-                                    progress_callback(max_videos if max_videos > 0 else 0, videos_yielded)
-                                
-                                # Check max videos limit
-                                if max_videos > 0 and videos_yielded >= max_videos:
-                                    process.terminate()
-                                    break
-                                    
-                    except json.JSONDecodeError:
-                        continue
-                
-                # Wait for process to complete with longer timeout for many videos
-                try:
-                    process.wait(timeout=300)  # 5 minutes timeout for large channels
-                except subprocess.TimeoutExpired:
-                    logger.warning("Process timeout - terminating")
-                    process.terminate()
-                    process.wait()
-                
-                # Check stderr for any issues but don't fail if we got videos
-                stderr_output = process.stderr.read() if process.stderr else ""
-                
-                if stderr_output:
-                    logger.debug(f"Approach {approach_idx + 1} stderr: {stderr_output[:500]}")
-                
-                if videos:
-                    logger.info(f"Successfully fetched {len(videos)} videos using approach {approach_idx + 1}")
-                    return videos
-                elif stderr_output:
-                    logger.warning(f"Approach {approach_idx + 1} failed: {stderr_output[:200]}")
-                else:
-                    logger.warning(f"Approach {approach_idx + 1} failed or returned no videos")
-                    
-            except subprocess.TimeoutExpired:
-                logger.warning(f"Approach {approach_idx + 1} timed out")
-                if videos:
-                    return videos
-                continue
-            except Exception as e:
-                logger.warning(f"Approach {approach_idx + 1} error: {e}")
-                if videos:
-                    return videos
+        approach_idx, run, first_video = race
+        stream = _stream_videos(run, first_video)
+        source = f"approach {approach_idx + 1}"
+    
+    logger.info(f"Streaming videos from {source}...")
+    
+    # Kept for the channel cache, which is only written once the listing ended
+    videos = []
+    seen_ids = set()
+    try:
+        for video_info in stream:
+            # TikTok pagination can loop and repeat entries; skip anything already listed
+            video_key = video_info['id'] or video_info['url']
+            if video_key in seen_ids:
                 continue
+            seen_ids.add(video_key)
+            
+            videos.append(video_info)
+            yield video_info
+            
+            # Update progress (throttled, a Qt signal per video would flood the UI)
+            progress.update(len(videos))
+            
+            # Check max videos limit
+            if max_videos > 0 and len(videos) >= max_videos:
+                if run:
+                    run.process.terminate()
+                break
+            
+            if cancel_event is not None and cancel_event.is_set():
+                break
+        
+        if cancel_event is not None and cancel_event.is_set():
+            logger.info(f"Channel listing cancelled after {len(videos)} videos: {channel_url}")
+            return
         
-        if not videos:
-            logger.error("All approaches failed to fetch channel videos")
-            return []
+        # A listing is complete unless it was cut short by max_videos
+        complete = max_videos <= 0 or len(videos) < max_videos
+        if run:
+            _finish_process(run.process)
+            
+            # Check stderr for any issues but don't fail since we got videos
+            stderr_output = run.stderr_text()
+            if stderr_output:
+                logger.debug("Approach {} stderr: {}", approach_idx + 1, stderr_output[:500])
             
-        return videos
+            # yt-dlp exits non-zero when pagination broke off (rate limit,
+            # extractor error): keep what was listed, but never serve it as
+            # the full channel
+            if run.process.returncode != 0:
+                logger.warning(f"yt-dlp exited with code {run.process.returncode} after "
+                               f"{len(videos)} videos, caching the listing as incomplete")
+                complete = False
+        
+        if save_cache:
+            save_cached(channel_url, videos, complete=complete)
             
+    except Exception as e:
+        logger.warning(f"{source.capitalize()} error: {e}")
+    finally:
+        # Also reached when the consumer closes the generator early
+        if run:
+            stream.close()  # releases the reader thread of _stream_videos
+            if run.process.poll() is None:
+                _stop_process(run.process)
+    
+    progress.update(len(videos), force=True)
+    logger.info(f"Successfully fetched {len(videos)} videos using {source}")
+
+
+def get_channel_videos(channel_url: str, max_videos: int = 0, progress_callback=None, video_callback=None,
+                       force_refresh: bool = False, rich_metadata: bool = False,
+                       cancel_event: Optional[threading.Event] = None, save_cache: bool = True) -> List[dict]:
+    """
+    Fetch all videos from a TikTok channel (see iter_channel_videos).
+    
+    Args:
+        channel_url: TikTok channel URL (e.g., https://www.tiktok.com/@username)
+        max_videos: Maximum number of videos to fetch (0 = no limit)
+        progress_callback: Callable(total_videos, current_progress) for progress updates
+        video_callback: Callable(video_info) called for each video as it's fetched
+        force_refresh: Ignore the on-disk channel cache and always run yt-dlp
+        rich_metadata: Parse full ``--dump-json`` documents instead of the compact
+            ``--print`` template
+        cancel_event: threading.Event that cancels the listing when set
+        save_cache: Write the fetched listing to the channel cache
+    
+    Returns:
+        List of all video info dicts (the videos fetched so far if an error occurred)
+    """
+    videos = []
+    try:
+        for video_info in iter_channel_videos(channel_url, max_videos, progress_callback,
+                                              force_refresh, rich_metadata, cancel_event, save_cache):
+            videos.append(video_info)
+            if video_callback:
+                video_callback(video_info)
     except Exception as e:
         logger.error(f"Error in get_channel_videos: {e}")
-        return []
+    return videos
+
+
+def update_channel_cache(channel_url: str, max_new: int = 30, progress_callback=None, video_callback=None,
+                         cancel_event: Optional[threading.Event] = None) -> Optional[List[dict]]:
+    """
+    Refresh a cached channel listing by fetching only its newest videos.
+
+    The newest ``max_new`` videos are fetched and merged by id in front of the
+    previously cached listing (regardless of its age), so a channel only has to
+    be crawled in full once. The partial fetch itself is never cached.
+
+    Args:
+        channel_url: TikTok channel URL
+        max_new: Number of newest videos to fetch
+        progress_callback: Callable(total_videos, current_progress) for progress updates
+        video_callback: Callable(video_info) called for each new video as it's fetched
+        cancel_event: threading.Event that cancels the refresh when set
+
+    Returns:
+        The merged list of video info dicts (the cached one if nothing could be
+        fetched), or None if the channel has to be listed in full instead: it
+        is not cached completely, the refresh was cancelled, or none of the
+        newest videos is cached yet (more may be missing in between)
+    """
+    cached, _, complete = load_cached(channel_url)
+    if not cached or not complete:
+        return None
+
+    newest = get_channel_videos(channel_url, max_videos=max_new, progress_callback=progress_callback,
+                                video_callback=video_callback, force_refresh=True,
+                                cancel_event=cancel_event, save_cache=False)
+    if cancel_event is not None and cancel_event.is_set():
+        return None
+    if not newest:
+        return cached
+
+    cached_ids = {video.get("id") for video in cached}
+    if len(newest) >= max_new and not any(video.get("id") in cached_ids for video in newest):
+        logger.info(f"No overlap with the cached listing of {channel_url}, listing it in full")
+        return None
+
+    new_ids = {video.get("id") for video in newest}
+    merged = newest + [video for video in cached if video.get("id") not in new_ids]
+    save_cached(channel_url, merged, complete=True)
+    logger.info(f"Updated channel cache for {channel_url}: {len(merged)} videos")
+    return merged
@@ -10,15 +10,24 @@ Supports two download methods:
 """
 
 import asyncio
+import hashlib
+import itertools
 import os
+import random
+import shutil
 import signal
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import List, Optional, Set
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Set, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PySide6.QtCore import QObject, QThread, Signal
 
 from src.core.tiktoksage_tiktokapi import check_tiktokapi_installed
@@ -29,6 +38,245 @@ from src.utils.tiktoksage_logger import logger
 # Shorthand for localization
 _ = LocalizationManager.get_text
 
+# Number of parallel HTTP range requests used for direct (TikTokApi) downloads
+RANGE_CONNECTIONS = 4
+
+# Files smaller than this are downloaded over a single connection
+RANGE_MIN_SIZE = 2 * 1024 * 1024
+
+# Bytes read per iteration when streaming a download to disk
+DOWNLOAD_CHUNK_SIZE = 128 * 1024
+
+# Number of videos the TikTokApi fallback downloads at the same time
+PARALLEL_DOWNLOADS = 5
+
+# Retries of a request answered with HTTP 429, and the longest Retry-After honoured (seconds)
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_MAX_WAIT = 30.0
+
+# (connect, read) timeouts of direct download requests (seconds)
+HTTP_TIMEOUT = (5, 30)
+
+# Flags for the raw file descriptors downloads are written through
+# (O_BINARY only exists, and is required, on Windows)
+_WRITE_FLAGS = os.O_WRONLY | getattr(os, "O_BINARY", 0)
+
+
+def _create_http_session() -> requests.Session:
+    """Create the pooled session used for direct downloads."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,  # enough for PARALLEL_DOWNLOADS videos x RANGE_CONNECTIONS ranges
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504), raise_on_status=False),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# One session for all downloads: connections (and their TLS sessions) to the
+# CDN are reused across range requests, retries and the videos of a batch
+_HTTP = _create_http_session()
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data to a raw file descriptor (os.write may write less)."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+# .part files being written by this process (see _claim_part_file)
+_ACTIVE_PARTS: Set[Path] = set()
+_ACTIVE_PARTS_LOCK = threading.Lock()
+
+
+def _claim_part_file(base_file: Path, video_id: str) -> Path:
+    """
+    Claim the .part file a download of video_id to base_file is written to.
+    
+    The .part name carries the video id, not just the (truncated) title, so a
+    file left behind by an interrupted download is only ever resumed by a
+    download of the same video. A second download of the same video in this
+    process gets a numbered .part file of its own.
+    
+    Returns:
+        The claimed .part path; release it with _release_part_file
+    """
+    with _ACTIVE_PARTS_LOCK:
+        for counter in itertools.count():
+            suffix = "" if counter == 0 else f"_{counter}"
+            part_file = base_file.with_name(f"{base_file.stem}.{video_id}{suffix}{base_file.suffix}.part")
+            if part_file not in _ACTIVE_PARTS:
+                _ACTIVE_PARTS.add(part_file)
+                return part_file
+
+
+def _release_part_file(part_file: Path) -> None:
+    """Release a .part file claimed with _claim_part_file."""
+    with _ACTIVE_PARTS_LOCK:
+        _ACTIVE_PARTS.discard(part_file)
+
+
+def _move_into_place(part_file: Path, base_file: Path) -> Path:
+    """
+    Move a finished .part file to base_file, or to the first free name_N variant of it.
+    
+    The name is taken with os.link, which fails instead of overwriting when the
+    name exists, so a file created by another download (of this or another
+    process) or by the user is never replaced. Filesystems without hard links
+    reserve the name with an O_EXCL placeholder, which the .part file replaces.
+    
+    Returns:
+        The final path of the download
+    """
+    for counter in itertools.count():
+        candidate = base_file if counter == 0 else base_file.with_stem(f"{base_file.stem}_{counter}")
+        try:
+            os.link(part_file, candidate)
+        except FileExistsError:
+            continue
+        except OSError:
+            # No hard links (e.g. FAT/exFAT drives)
+            try:
+                fd = os.open(str(candidate), _WRITE_FLAGS | os.O_CREAT | os.O_EXCL, 0o644)
+            except FileExistsError:
+                continue
+            os.close(fd)
+            os.replace(part_file, candidate)
+            return candidate
+        part_file.unlink()
+        return candidate
+
+
+# Video info fields read from a TikTokApi Video object: (name, attribute path, default)
+_VIDEO_INFO_FIELDS = (
+    ("author", ("author", "uniqueId"), "Unknown"),
+    ("likes", ("statistics", "diggCount"), 0),
+    ("comments", ("statistics", "commentCount"), 0),
+    ("shares", ("statistics", "shareCount"), 0),
+    ("duration", ("video", "duration"), 0),
+    ("cover", ("dynamicCover",), ""),
+)
+
+
+def _dig(obj, path: Tuple[str, ...], default):
+    """Follow the attribute path from obj, returning default if any step is missing or None."""
+    for name in path:
+        obj = getattr(obj, name, None)
+        if obj is None:
+            return default
+    return obj
+
+
+def _retry_after_seconds(response: requests.Response) -> float:
+    """Return the wait requested by a 429 response's Retry-After header (seconds or HTTP date)."""
+    value = response.headers.get("Retry-After", "1").strip()
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            delay = 1.0
+    return min(max(delay, 0.0), RATE_LIMIT_MAX_WAIT)
+
+# TikTokApi session creation retries: attempts, backoff base/cap and overall budget (seconds)
+SESSION_MAX_RETRIES = 4
+SESSION_BACKOFF_BASE = 0.2
+SESSION_BACKOFF_CAP = 5.0
+SESSION_RETRY_BUDGET = 10.0
+
+# Head start yt-dlp gets on a video info lookup before the (browser based,
+# much heavier) TikTokApi backend is started as well (seconds)
+TIKTOKAPI_HEAD_START = 1.5
+
+
+# yt-dlp imports all of its extractors, which takes seconds on slow machines;
+# import it once in the background as soon as this module is loaded
+_yt_dlp = None
+_yt_dlp_loaded = threading.Event()
+
+# Extractors YoutubeDL instances are limited to (regexes matched against
+# extractor names): only TikTok URLs are ever passed, so the other (well
+# over a thousand) extractors are never instantiated
+YTDLP_EXTRACTORS = [r'tiktok(:.*)?', r'vm\.tiktok', 'generic']
+
+
+def _preload_ytdlp() -> None:
+    """Import yt_dlp into the module cache (runs on a daemon thread)."""
+    global _yt_dlp
+    try:
+        import yt_dlp
+        _yt_dlp = yt_dlp
+    except ImportError:
+        logger.warning("yt-dlp not installed, downloads will use TikTokApi")
+    except Exception as e:
+        logger.warning(f"Could not import yt-dlp: {e}")
+    finally:
+        _yt_dlp_loaded.set()
+    
+    if _yt_dlp is not None:
+        # Load the extractor classes too, before the first YoutubeDL needs them
+        try:
+            _yt_dlp.extractor.gen_extractor_classes()
+        except Exception as e:
+            logger.debug(f"Could not preload yt-dlp extractors: {e}")
+
+
+def _get_ytdlp():
+    """Return the yt_dlp module (None if unavailable), waiting for the background import."""
+    _yt_dlp_loaded.wait()
+    return _yt_dlp
+
+
+threading.Thread(target=_preload_ytdlp, name="yt-dlp-preload", daemon=True).start()
+
+
+# TikTokApi pulls in Playwright, which is slow to import; it is only imported
+# the first time a TikTokApi session is needed, by whichever thread gets there first
+_TikTokApi = None
+_tiktokapi_lock = threading.Lock()
+
+
+def _get_tiktokapi_class():
+    """Return the TikTokApi class, importing it on first use."""
+    global _TikTokApi
+    with _tiktokapi_lock:
+        if _TikTokApi is None:
+            from TikTokApi import TikTokApi
+            _TikTokApi = TikTokApi
+        return _TikTokApi
+
+
+async def _retry_create_sessions(api) -> Optional[str]:
+    """
+    Create TikTokApi sessions, retrying with truncated exponential backoff.
+    
+    Each retry sleeps a random time up to ``min(cap, base * 2**attempt)`` (full
+    jitter), and no retry is started once SESSION_RETRY_BUDGET is used up.
+    
+    Returns:
+        None if the sessions were created, otherwise the last error message
+    """
+    started = time.monotonic()
+    last_error = None
+    
+    for attempt in range(SESSION_MAX_RETRIES):
+        try:
+            await api.create_sessions()
+            return None
+        except Exception as e:
+            last_error = str(e)
+            if attempt == SESSION_MAX_RETRIES - 1 or time.monotonic() - started > SESSION_RETRY_BUDGET:
+                break
+            logger.warning(f"Session creation failed (attempt {attempt + 1}/{SESSION_MAX_RETRIES}): {e}")
+            delay = min(SESSION_BACKOFF_CAP, SESSION_BACKOFF_BASE * 2 ** attempt)
+            await asyncio.sleep(random.uniform(0, delay))
+    
+    return last_error
+
 
 class SignalManager(QObject):
     """Manages signals for download operations."""
@@ -41,18 +289,27 @@ class SignalManager(QObject):
 
 
 class DownloadThread(QThread):
-    """Thread for downloading TikTok videos."""
+    """
+    Thread for downloading a batch of TikTok videos.
+    
+    All URLs share one yt-dlp instance and, for the ones yt-dlp cannot
+    download, one TikTokApi session, so their startup cost is paid once per
+    batch instead of once per video.
+    """
     
-    progress_signal = Signal(float)
+    # (index of the URL in the batch, percent): only emitted when a video starts and
+    # finishes, intermediate progress is polled with take_progress()
+    progress_signal = Signal(int, float)
     status_signal = Signal(str)
     finished_signal = Signal()
+    item_finished_signal = Signal(int, str)  # (index of the URL in the batch, downloaded file path)
     error_signal = Signal(str)
     file_exists_signal = Signal(str)
     update_details = Signal(str)
 
     def __init__(
         self,
-        url: str,
+        urls: List[str],
         path: str,
         is_audio_only: bool = False,
         proxy_url: Optional[str] = None,
@@ -60,7 +317,9 @@ class DownloadThread(QThread):
         save_description: bool = False,
     ) -> None:
         super().__init__()
-        self.url = url
+        self.urls = list(urls)
+        self.current_index = 0
+        self.url = self.urls[0] if self.urls else ""  # URL currently being downloaded
         self.path = Path(path)
         self.is_audio_only = is_audio_only
         self.proxy_url = proxy_url
@@ -71,218 +330,457 @@ class DownloadThread(QThread):
         self.process: Optional[subprocess.Popen] = None
         self.initial_subtitle_files: Set[Path] = set()
         self.subtitle_files: Optional[List[Path]] = None
-        self.downloaded_file_path: Optional[str] = None  # Store the actual downloaded file path
+        self.downloaded_file_path: Optional[str] = None  # Path of the last downloaded file
+        self.completed_count = 0
+        self._last_error: Optional[str] = None  # Reported if no URL of the batch could be downloaded
+        self._pending_progress: Dict[int, float] = {}  # Latest progress per batch index, see take_progress()
+        self._current_responses: Set[requests.Response] = set()  # Closed by cancel() to abort copies
+        self._cancel_event = threading.Event()  # Interrupts rate limit waits
 
     def run(self) -> None:
-        """Execute the download."""
+        """Execute the downloads."""
         try:
             self.status_signal.emit(_("download.preparing"))
             
             # Ensure path exists
             self.path.mkdir(parents=True, exist_ok=True)
             
-            logger.info(f"Starting download: {self.url}")
+            logger.info(f"Starting download of {len(self.urls)} URL(s): {self.urls[0] if self.urls else ''}")
             self.status_signal.emit(_("download.downloading"))
             
-            # Try yt-dlp first (more reliable)
-            if self._try_ytdlp_download():
-                return
+            # Try yt-dlp first (more reliable); it returns the URLs it could not download
+            pending = self._try_ytdlp_download()
             
-            # Fallback to TikTokApi if yt-dlp fails
-            logger.info("yt-dlp download failed, trying TikTokApi...")
+            # Fallback to TikTokApi for those
+            if pending and not self.cancelled:
+                logger.info(f"yt-dlp download failed for {len(pending)} URL(s), trying TikTokApi...")
+                
+                if not check_tiktokapi_installed():
+                    self._last_error = _("errors.tiktokapi_not_installed")
+                else:
+                    # Run async code in asyncio event loop
+                    loop = asyncio.new_event_loop()
+                    asyncio.set_event_loop(loop)
+                    try:
+                        loop.run_until_complete(self._download_async(pending))
+                    finally:
+                        loop.close()
             
-            if not check_tiktokapi_installed():
-                self.error_signal.emit(_("errors.tiktokapi_not_installed"))
+            if self.cancelled:
                 return
-            
-            # Run async code in asyncio event loop
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                loop.run_until_complete(self._download_async())
-            finally:
-                loop.close()
+            if self.completed_count:
+                self.status_signal.emit(_("download.completed"))
+                self.finished_signal.emit()
+            elif self._last_error:
+                self.error_signal.emit(self._last_error)
                 
         except Exception as e:
             logger.exception(f"Download error: {e}")
             self.error_signal.emit(str(e))
 
-    def _try_ytdlp_download(self) -> bool:
+    def _start_item(self, index: int) -> None:
+        """Make the URL at index the current one."""
+        self.current_index = index
+        self.url = self.urls[index]
+        self.progress_signal.emit(index, 0.0)
+
+    def _finish_item(self, index: int, file_path: str) -> None:
+        """Report the URL at index as downloaded to file_path."""
+        self.downloaded_file_path = file_path
+        self.completed_count += 1
+        self.progress_signal.emit(index, 100.0)
+        self.item_finished_signal.emit(index, file_path)
+
+    def _try_ytdlp_download(self) -> List[int]:
         """
-        Try downloading using yt-dlp.
+        Try downloading every URL using one yt-dlp instance.
         
         Returns:
-            True if successful, False otherwise
+            Indexes of the URLs that were not downloaded
         """
-        try:
-            import yt_dlp
-        except ImportError:
+        yt_dlp = _get_ytdlp()
+        if yt_dlp is None:
             logger.warning("yt-dlp not installed, will try TikTokApi")
-            return False
+            return list(range(len(self.urls)))
         
+        downloaded: Set[int] = set()
         try:
-            logger.info("Attempting download with yt-dlp...")
-            
             output_template = str(self.path / '%(title)s.%(ext)s')
             
             ydl_opts = {
                 'format': 'best[ext=mp4]' if not self.is_audio_only else 'bestaudio[ext=m4a]',
                 'outtmpl': output_template,
-                'quiet': False,
+                'quiet': True,
+                'no_progress': True,
                 'no_warnings': True,
                 'socket_timeout': 30,
                 'no_color': True,
+                'allowed_extractors': YTDLP_EXTRACTORS,
+                # Report progress in-process instead of printing a progress bar
+                'progress_hooks': [self._ytdlp_progress_hook],
+                # Fetch fragmented (DASH/HLS) formats over several connections
+                'concurrent_fragment_downloads': 4,
             }
             
+            # URLs are extracted one by one (instead of ydl.download(urls)) so each
+            # file path and failure can be reported against its index
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(self.url, download=True)
-                filepath = ydl.prepare_filename(info)
-            
-            logger.info(f"Download completed with yt-dlp: {filepath}")
-            self.downloaded_file_path = str(filepath)  # Store the actual file path
-            self.progress_signal.emit(100.0)
-            self.status_signal.emit(_("download.completed"))
-            self.finished_signal.emit()
-            return True
+                for index, url in enumerate(self.urls):
+                    if self.cancelled:
+                        break
+                    self._start_item(index)
+                    try:
+                        logger.info(f"Attempting download with yt-dlp: {url}")
+                        info = ydl.extract_info(url, download=True)
+                        filepath = ydl.prepare_filename(info)
+                    except Exception as e:
+                        logger.warning(f"yt-dlp download failed for {url}: {e}")
+                        continue
+                    
+                    logger.info(f"Download completed with yt-dlp: {filepath}")
+                    self._finish_item(index, str(filepath))
+                    downloaded.add(index)
             
         except Exception as e:
             logger.warning(f"yt-dlp download failed: {e}")
-            return False
+        
+        return [index for index in range(len(self.urls)) if index not in downloaded]
 
-        except Exception as e:
-            logger.exception(f"Download error: {e}")
-            self.error_signal.emit(str(e))
+    def _ytdlp_progress_hook(self, status: dict) -> None:
+        """yt-dlp progress hook: forward download progress, abort the download on cancel."""
+        if self.cancelled:
+            raise _get_ytdlp().utils.DownloadCancelled()
+        if status.get('status') != 'downloading':
+            return
+        total = status.get('total_bytes') or status.get('total_bytes_estimate') or 0
+        if total:
+            self._update_progress(self.current_index, min(100.0 * status.get('downloaded_bytes', 0) / total, 99.9))
 
-    async def _download_async(self) -> None:
-        """Async method to download video."""
-        from TikTokApi import TikTokApi
-        
-        api = TikTokApi()
+    async def _download_async(self, indexes: List[int]) -> None:
+        """Async method to download the videos at indexes with one TikTokApi session."""
+        api = _get_tiktokapi_class()()
         
         # Retry logic for timeout issues
-        max_retries = 2
-        session_created = False
-        last_error = None
+        last_error = await _retry_create_sessions(api)
         
-        for attempt in range(max_retries):
+        # Only proceed if sessions were successfully created
+        if last_error is not None:
+            logger.error(f"Session creation failed: {last_error}")
+            self._last_error = "Failed to connect to TikTok. Please check your internet connection or try using a VPN."
+            return
+        
+        # Download up to PARALLEL_DOWNLOADS videos at a time: faster than one by
+        # one, without hitting the CDN hard enough to get rate limited
+        semaphore = asyncio.Semaphore(PARALLEL_DOWNLOADS)
+        
+        async def download(index: int) -> None:
+            async with semaphore:
+                if self.cancelled:
+                    return
+                self._start_item(index)
+                try:
+                    await self._download_video_async(api, index)
+                except Exception as e:
+                    logger.exception(f"Error downloading {self.urls[index]}: {e}")
+                    self._last_error = str(e)
+        
+        try:
+            await asyncio.gather(*(download(index) for index in indexes))
+        finally:
             try:
-                await api.create_sessions()
-                session_created = True
-                break
+                await api.close_sessions()
             except Exception as e:
-                last_error = str(e)
-                if attempt < max_retries - 1:
-                    logger.warning(f"Session creation failed (attempt {attempt + 1}/{max_retries}): {e}")
-                    await asyncio.sleep(2)  # Wait 2 seconds before retry
+                logger.warning(f"Error closing API sessions: {e}")
+
+    async def _download_video_async(self, api, index: int) -> None:
+        """Download the video at index through an open TikTokApi session."""
+        url = self.urls[index]
         
-        # Only proceed if sessions were successfully created
-        if not session_created:
-            error_msg = f"Failed to connect to TikTok. Please check your internet connection or try using a VPN."
-            logger.error(f"Session creation failed: {last_error}")
-            self.error_signal.emit(error_msg)
+        # Get video info using the video method (NOT async, returns Video object directly)
+        video_data = api.video(url=url)
+        
+        if self.cancelled:
+            return
+        
+        if not video_data:
+            self._last_error = _("errors.could_not_fetch_video_info")
             return
         
+        # Extract download URLs from video object
+        download_url = _dig(video_data, ("video", "downloadAddr"), None) or _dig(video_data, ("video", "playAddr"), None)
+        
+        if not download_url:
+            self._last_error = _("errors.could_not_fetch_video_info")
+            return
+        
+        # Determine file extension and name
+        ext = ".mp4" if not self.is_audio_only else ".m4a"
+        title = str(_dig(video_data, ("desc",), "video"))[:50]
+        title = title.replace(" ", "_").replace("/", "_")
+        
+        # Download the video
+        logger.info(f"Downloading from: {download_url}")
+        # The transfer uses blocking requests calls; run it in a worker thread so
+        # the event loop (and the TikTokApi/Playwright session on it) stays responsive
+        video_id = str(_dig(video_data, ("id",), "")) or hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
+        output_file = await asyncio.to_thread(
+            self._download_file, index, download_url, self.path / f"{title}{ext}", video_id
+        )
+        if output_file is None:
+            self.status_signal.emit(_("download.cancelled"))
+            return
+        
+        self._finish_item(index, str(output_file))
+        logger.info(f"Download completed: {output_file}")
+        
+        # Save description if requested (after reporting the video as done, and
+        # off the event loop so the other downloads are not held up)
+        if self.save_description:
+            try:
+                desc = _dig(video_data, ("desc",), "")
+                if desc:
+                    desc_path = self.path / f"{title}_description.txt"
+                    await asyncio.to_thread(desc_path.write_bytes, str(desc).encode("utf-8"))
+                    logger.info(f"Description saved to {desc_path}")
+            except Exception as e:
+                logger.warning(f"Could not save description: {e}")
+
+    def _download_file(self, index: int, download_url: str, base_file: Path, video_id: str) -> Optional[Path]:
+        """
+        Download a direct media URL to base_file, or to a free name_N variant of it.
+        
+        Every download is written to a .part file keyed by video_id and moved to
+        its final name only once complete, so a file at the final name is always
+        a finished download: one at base_file with the expected size is reused.
+        A streamed .part left by an interrupted download of the same video is
+        resumed with a Range request.
+        Otherwise large files on servers that accept byte ranges are fetched
+        over RANGE_CONNECTIONS parallel connections, each writing its own slice
+        of the preallocated .part file; everything else is streamed over one
+        connection.
+        
+        Returns:
+            Path of the downloaded file, or None if the download was cancelled
+        """
+        total_size, accepts_ranges = self._probe_size(download_url)
+        
+        if total_size and base_file.is_file() and base_file.stat().st_size == total_size:
+            logger.info(f"Already downloaded, skipping: {base_file}")
+            return base_file
+        
+        part_file = _claim_part_file(base_file, video_id)
         try:
-            # Get video info using the video method (NOT async, returns Video object directly)
-            video_data = api.video(url=self.url)
-            
-            if self.cancelled:
-                return
-            
-            if not video_data:
-                self.error_signal.emit(_("errors.could_not_fetch_video_info"))
-                return
+            return self._download_part(index, download_url, part_file, base_file, total_size, accepts_ranges)
+        finally:
+            _release_part_file(part_file)
+
+    def _download_part(self, index: int, download_url: str, part_file: Path, base_file: Path,
+                       total_size: int, accepts_ranges: bool) -> Optional[Path]:
+        """Download into a claimed .part file and move it into place once complete."""
+        # A preallocated (ranged) .part already has the full size, holes
+        # included, so only a shorter one can be an interrupted stream
+        resume_from = part_file.stat().st_size if accepts_ranges and part_file.is_file() else 0
+        if 0 < resume_from < total_size:
+            logger.info(f"Resuming {part_file} from byte {resume_from}")
+        else:
+            resume_from = 0
+        
+        ranged = False
+        try:
+            if not resume_from and accepts_ranges and total_size >= RANGE_MIN_SIZE:
+                ranged = True
+                try:
+                    completed = self._download_ranges(index, download_url, part_file, total_size)
+                except Exception as e:
+                    if self.cancelled:
+                        completed = False
+                    else:
+                        logger.warning(f"Parallel range download failed, retrying with one connection: {e}")
+                        ranged = False
+                        completed = self._download_stream(index, download_url, part_file)
+            else:
+                completed = self._download_stream(index, download_url, part_file, resume_from)
+        except Exception:
+            # A preallocated file has holes and is never resumed; keep what was
+            # streamed, so that the next attempt resumes it
+            if ranged or (part_file.is_file() and part_file.stat().st_size == 0):
+                part_file.unlink(missing_ok=True)
+            raise
+        
+        if not completed:
+            part_file.unlink(missing_ok=True)
+            return None
+        return _move_into_place(part_file, base_file)
+
+    def _probe_size(self, download_url: str) -> Tuple[int, bool]:
+        """Return the file size (0 if unknown) and whether the server accepts byte ranges."""
+        try:
+            response = _HTTP.head(download_url, allow_redirects=True, timeout=HTTP_TIMEOUT)
+        except requests.RequestException as e:
+            logger.debug(f"HEAD request failed, not using range requests: {e}")
+            return 0, False
+        
+        if response.status_code != 200:
+            return 0, False
+        total_size = int(response.headers.get('content-length', 0) or 0)
+        return total_size, response.headers.get('accept-ranges', '').lower() == 'bytes'
+
+    def _download_ranges(self, index: int, download_url: str, output_file: Path, total_size: int) -> bool:
+        """Download total_size bytes as RANGE_CONNECTIONS concurrent byte ranges."""
+        with open(output_file, 'wb') as f:
+            f.truncate(total_size)
+        
+        part_size = -(-total_size // RANGE_CONNECTIONS)  # ceil division
+        ranges = [(start, min(start + part_size, total_size) - 1) for start in range(0, total_size, part_size)]
+        
+        lock = threading.Lock()
+        abort = threading.Event()
+        downloaded = 0
+        
+        def add_progress(size: int) -> None:
+            nonlocal downloaded
+            with lock:
+                downloaded += size
+                progress = (downloaded / total_size) * 100
+            self._update_progress(index, progress)
+        
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [
+                executor.submit(self._download_range, download_url, output_file, start, end, add_progress, abort)
+                for start, end in ranges
+            ]
+            done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+            # Stop the remaining ranges as soon as one of them failed
+            if any(future.exception() for future in done):
+                abort.set()
+            results = [future.result() for future in futures]
+        
+        logger.debug(f"Range download finished with {len(ranges)} connections")
+        return all(results)
+
+    def _download_range(self, download_url: str, output_file: Path, start: int, end: int,
+                        add_progress, abort: threading.Event) -> bool:
+        """Download bytes start..end (inclusive) into their offset of output_file."""
+        headers = {'Range': f'bytes={start}-{end}'}
+        with self._get(download_url, headers=headers, stream=True, timeout=HTTP_TIMEOUT) as response:
+            if response.status_code != 206:
+                raise RuntimeError(f"Range request not honoured: HTTP {response.status_code}")
             
-            # Extract download URLs from video object
-            download_url = None
+            fd = os.open(str(output_file), _WRITE_FLAGS)
             try:
-                if hasattr(video_data, 'video') and hasattr(video_data.video, 'downloadAddr'):
-                    download_url = video_data.video.downloadAddr
-                elif hasattr(video_data, 'video') and hasattr(video_data.video, 'playAddr'):
-                    download_url = video_data.video.playAddr
-            except:
-                pass
-            
-            if not download_url:
-                self.error_signal.emit(_("errors.could_not_fetch_video_info"))
-                return
+                os.lseek(fd, start, os.SEEK_SET)
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if self.cancelled or abort.is_set():
+                        return False
+                    if chunk:
+                        _write_all(fd, chunk)
+                        add_progress(len(chunk))
+            finally:
+                os.close(fd)
+        return True
+
+    def _download_stream(self, index: int, download_url: str, output_file: Path, resume_from: int = 0) -> bool:
+        """
+        Download a URL over a single streamed connection.
+        
+        With resume_from, only the bytes from that offset on are requested and
+        appended to output_file; if the server answers with the whole file
+        instead, output_file is overwritten.
+        """
+        headers = {'Range': f'bytes={resume_from}-'} if resume_from else None
+        with self._get(download_url, headers=headers, stream=True, timeout=HTTP_TIMEOUT) as response:
+            if resume_from and response.status_code == 206:
+                content_range = response.headers.get('content-range', '')
+                if not content_range.startswith(f"bytes {resume_from}-"):
+                    raise RuntimeError(f"Unexpected Content-Range for resumed download: {content_range!r}")
+                downloaded = resume_from
+                open_flags = _WRITE_FLAGS | os.O_APPEND
+            elif response.status_code == 200:
+                downloaded = 0
+                open_flags = _WRITE_FLAGS | os.O_CREAT | os.O_TRUNC
+            else:
+                raise RuntimeError(f"Download failed: HTTP {response.status_code}")
             
-            # Download the video
-            logger.info(f"Downloading from: {download_url}")
-            response = requests.get(download_url, stream=True, timeout=30)
+            # Download file with progress tracking
+            content_length = int(response.headers.get('content-length', 0) or 0)
+            total_size = downloaded + content_length if content_length else 0
             
-            if response.status_code != 200:
-                self.error_signal.emit(f"Download failed: HTTP {response.status_code}")
-                return
+            if total_size == 0:
+                # No Content-Length means no progress to report: copy with the C-level
+                # loop of copyfileobj; cancel() aborts it by closing the response
+                self._current_responses.add(response)
+                try:
+                    response.raw.decode_content = True
+                    with open(output_file, 'ab' if downloaded else 'wb') as f:
+                        shutil.copyfileobj(response.raw, f, length=1024 * 1024)
+                except Exception:
+                    if self.cancelled:
+                        return False
+                    raise
+                finally:
+                    self._current_responses.discard(response)
+                return not self.cancelled
             
-            # Determine file extension and name
-            ext = ".mp4" if not self.is_audio_only else ".m4a"
+            # Large chunks written straight to the fd: no buffered file object layer,
+            # and far fewer Python iterations (and progress updates) per megabyte
+            fd = os.open(str(output_file), open_flags, 0o644)
             try:
-                title = str(video_data.desc)[:50] if hasattr(video_data, 'desc') else "video"
-            except:
-                title = "video"
-            title = title.replace(" ", "_").replace("/", "_")
-            output_file = self.path / f"{title}{ext}"
-            
-            # Ensure unique filename
-            counter = 1
-            base_file = output_file
-            while output_file.exists():
-                stem = base_file.stem + f"_{counter}"
-                output_file = base_file.parent / (stem + base_file.suffix)
-                counter += 1
-            
-            # Download file with progress tracking
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
-            
-            with open(output_file, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     if self.cancelled:
-                        output_file.unlink(missing_ok=True)
-                        self.status_signal.emit(_("download.cancelled"))
-                        return
+                        return False
                     
                     if chunk:
-                        f.write(chunk)
+                        _write_all(fd, chunk)
                         downloaded += len(chunk)
                         if total_size > 0:
                             progress = (downloaded / total_size) * 100
-                            self._update_progress(progress)
-            
-            # Store the downloaded file path
-            self.downloaded_file_path = str(output_file)
-            
-            # Save description if requested
-            if self.save_description:
-                try:
-                    desc = video_data.desc if hasattr(video_data, 'desc') else ""
-                    if desc:
-                        desc_path = self.path / f"{title}_description.txt"
-                        with open(desc_path, "w", encoding="utf-8") as f:
-                            f.write(desc)
-                        logger.info(f"Description saved to {desc_path}")
-                except Exception as e:
-                    logger.warning(f"Could not save description: {e}")
-            
-            self.progress_signal.emit(100.0)
-            self.status_signal.emit(_("download.completed"))
-            self.finished_signal.emit()
-            logger.info(f"Download completed: {output_file}")
+                            self._update_progress(index, progress)
+            finally:
+                os.close(fd)
+        return True
+
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """
+        GET through the shared session that waits out HTTP 429 responses.
+        
+        The Retry-After delay is honoured up to RATE_LIMIT_RETRIES times; the
+        last response is returned whatever its status.
+        """
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            response = _HTTP.get(url, **kwargs)
+            if response.status_code != 429 or attempt == RATE_LIMIT_RETRIES or self.cancelled:
+                return response
             
-        except Exception as e:
-            logger.exception(f"Error in _download_async: {e}")
-            raise
-        finally:
-            try:
-                await api.close_sessions()
-            except Exception as e:
-                logger.warning(f"Error closing API sessions: {e}")
+            delay = _retry_after_seconds(response)
+            response.close()
+            logger.warning(f"Rate limited (HTTP 429), retrying in {delay:.1f}s ({attempt + 1}/{RATE_LIMIT_RETRIES})")
+            self._cancel_event.wait(delay)
+        return response
 
-    def _update_progress(self, progress: float) -> None:
-        """Update download progress."""
-        if not self.cancelled:
-            self.progress_signal.emit(progress)
+    def _update_progress(self, index: int, progress: float) -> None:
+        """
+        Update download progress.
+        
+        Per-chunk updates only overwrite the pending value (no cross-thread
+        signal per chunk); 100% is still emitted through progress_signal.
+        """
+        if self.cancelled:
+            return
+        if progress >= 100:
+            self._pending_progress.pop(index, None)
+            self.progress_signal.emit(index, progress)
+        else:
+            self._pending_progress[index] = progress
+
+    def take_progress(self) -> Dict[int, float]:
+        """
+        Return the progress updates since the last call, by batch index.
+        
+        Meant to be polled by the GUI on a timer, which coalesces any number
+        of chunk updates into one progress bar update per tick.
+        """
+        pending, self._pending_progress = self._pending_progress, {}
+        return pending
 
     def pause(self) -> None:
         """Pause the download."""
@@ -309,6 +807,12 @@ class DownloadThread(QThread):
     def cancel(self) -> None:
         """Cancel the download."""
         self.cancelled = True
+        self._cancel_event.set()
+        for response in list(self._current_responses):
+            try:
+                response.close()
+            except Exception as e:
+                logger.debug(f"Error closing download response: {e}")
         if self.process:
             self._kill_process_tree()
 
@@ -330,9 +834,14 @@ class DownloadThread(QThread):
                 logger.debug(f"Killed process tree on Windows (PID: {pid})")
             else:
                 try:
-                    os.killpg(os.getpgid(pid), signal.SIGTERM)
-                    time.sleep(0.5)
-                    os.killpg(os.getpgid(pid), signal.SIGKILL)
+                    pgid = os.getpgid(pid)
+                    os.killpg(pgid, signal.SIGTERM)
+                    # Escalate only if the process ignores SIGTERM, instead of always
+                    # sleeping before the SIGKILL
+                    try:
+                        self.process.wait(timeout=0.2)
+                    except subprocess.TimeoutExpired:
+                        os.killpg(pgid, signal.SIGKILL)
                 except (ProcessLookupError, PermissionError):
                     pass
                 logger.debug(f"Killed process group on Unix (PID: {pid})")
@@ -356,6 +865,12 @@ class VideoInfoThread(QThread):
     error_signal = Signal(str)
     finished_signal = Signal()
     progress_signal = Signal(float)  # Emit progress percentage
+    
+    # One YoutubeDL instance is shared by all info lookups (its options never
+    # change); YoutubeDL is not thread-safe, so it is only used by whoever holds
+    # the lock (a lookup finding it held uses a one-off instance)
+    _ydl_info = None
+    _ydl_info_lock = threading.Lock()
 
     def __init__(self, url: str, cookie_file: Optional[str] = None) -> None:
         super().__init__()
@@ -369,48 +884,88 @@ class VideoInfoThread(QThread):
             logger.info(f"Fetching video info: {self.url}")
             self.progress_signal.emit(10)  # Start at 10%
             
-            # Try yt-dlp first (more reliable)
-            if self._try_ytdlp_video_info():
-                self.progress_signal.emit(100)
-                return
-            
-            # Fallback to TikTokApi if yt-dlp fails
-            self.progress_signal.emit(50)
-            logger.info("yt-dlp video info failed, trying TikTokApi...")
-            
-            if not check_tiktokapi_installed():
-                self.error_signal.emit(_("errors.tiktokapi_not_installed"))
-                return
-            
-            from TikTokApi import TikTokApi
-            
             # Run async code in asyncio event loop
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
             try:
-                loop.run_until_complete(self._fetch_video_async())
+                formatted_info = loop.run_until_complete(self._race_video_info())
             finally:
                 loop.close()
             
+            if formatted_info and not self.cancelled:
+                self.video_info_signal.emit(formatted_info)
+            
             self.progress_signal.emit(100)
-            self.finished_signal.emit()
             
         except Exception as e:
             logger.exception(f"Error fetching video info: {e}")
             self.error_signal.emit(str(e))
+        finally:
+            self.finished_signal.emit()
 
-    def _try_ytdlp_video_info(self) -> bool:
+    async def _race_video_info(self) -> Optional[dict]:
         """
-        Try fetching video info using yt-dlp.
+        Query yt-dlp, then race it against TikTokApi if it is slow, and return the first video info.
+        
+        yt-dlp usually answers within a second, so the TikTokApi backend (which
+        starts a Playwright browser session) is only started when yt-dlp failed
+        or has not answered within TIKTOKAPI_HEAD_START seconds. From then on
+        the first backend to return wins and the other one is cancelled.
         
         Returns:
-            True if successful, False otherwise
+            Formatted video info, or None if both backends failed (an error was emitted)
         """
+        tasks = {asyncio.ensure_future(asyncio.to_thread(self._try_ytdlp_video_info))}
+        tiktokapi_started = False
+        timeout = TIKTOKAPI_HEAD_START
+        
+        last_error = None
         try:
-            import yt_dlp
-        except ImportError:
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        last_error = task.exception()
+                        logger.warning(f"Video info backend failed: {last_error}")
+                    elif task.result():
+                        return task.result()
+                
+                if not tiktokapi_started and not self.cancelled:
+                    # yt-dlp failed or is taking long: bring in the fallback
+                    tiktokapi_started = True
+                    timeout = None
+                    if check_tiktokapi_installed():
+                        logger.info("yt-dlp has no video info yet, starting TikTokApi as well")
+                        tasks.add(asyncio.ensure_future(self._fetch_video_async()))
+                    else:
+                        logger.info("TikTokApi not installed, fetching video info with yt-dlp only")
+                if tasks:
+                    self.progress_signal.emit(50)
+        finally:
+            # Cancel the slower backend. A yt-dlp call already running in its
+            # worker thread cannot be interrupted: it finishes in the background
+            # (its result is dropped) while still holding _ydl_info_lock, which
+            # is why _try_ytdlp_video_info doesn't wait for that lock
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        
+        if not self.cancelled:
+            self.error_signal.emit(str(last_error) if last_error else _("errors.could_not_fetch_video_info"))
+        return None
+
+    def _try_ytdlp_video_info(self) -> Optional[dict]:
+        """
+        Try fetching video info using yt-dlp.
+        
+        Returns:
+            Formatted video info, or None if yt-dlp is unavailable or failed
+        """
+        yt_dlp = _get_ytdlp()
+        if yt_dlp is None:
             logger.warning("yt-dlp not installed, will try TikTokApi")
-            return False
+            return None
         
         try:
             logger.info("Attempting to get video info with yt-dlp...")
@@ -420,10 +975,22 @@ class VideoInfoThread(QThread):
                 'no_warnings': True,
                 'extract_flat': True,
                 'socket_timeout': 30,
+                'allowed_extractors': YTDLP_EXTRACTORS,
             }
-            
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(self.url, download=False)
+            # The shared instance may still be held by the abandoned yt-dlp call
+            # of an earlier lookup that TikTokApi won (see _race_video_info);
+            # don't queue behind it, use a one-off instance instead
+            if VideoInfoThread._ydl_info_lock.acquire(blocking=False):
+                try:
+                    if VideoInfoThread._ydl_info is None:
+                        VideoInfoThread._ydl_info = yt_dlp.YoutubeDL(ydl_opts)
+                    info = VideoInfoThread._ydl_info.extract_info(self.url, download=False)
+                finally:
+                    VideoInfoThread._ydl_info_lock.release()
+            else:
+                logger.debug("Shared yt-dlp instance busy, using a one-off instance")
+                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                    info = ydl.extract_info(self.url, download=False)
             
             if info:
                 # Format the data for display
@@ -439,101 +1006,56 @@ class VideoInfoThread(QThread):
                 }
                 
                 logger.info(f"Video info fetched successfully with yt-dlp: {formatted_info['title']}")
-                self.video_info_signal.emit(formatted_info)
-                self.finished_signal.emit()
-                return True
+                return formatted_info
             else:
                 logger.warning("yt-dlp returned empty info")
-                return False
+                return None
                 
         except Exception as e:
             logger.warning(f"yt-dlp video info failed: {e}")
-            return False
+            return None
 
 
-    async def _fetch_video_async(self) -> None:
-        """Async method to fetch video information."""
-        from TikTokApi import TikTokApi
+    async def _fetch_video_async(self) -> Optional[dict]:
+        """
+        Async method to fetch video information with TikTokApi.
         
-        api = TikTokApi()
+        Returns:
+            Formatted video info, or None if TikTok returned no video
         
-        # Retry logic for timeout issues
-        max_retries = 2
-        session_created = False
-        last_error = None
+        Raises:
+            RuntimeError: If no TikTokApi session could be created
+        """
+        api = _get_tiktokapi_class()()
         
-        for attempt in range(max_retries):
-            try:
-                await api.create_sessions()
-                session_created = True
-                break
-            except Exception as e:
-                last_error = str(e)
-                if attempt < max_retries - 1:
-                    logger.warning(f"Session creation failed (attempt {attempt + 1}/{max_retries}): {e}")
-                    await asyncio.sleep(2)  # Wait 2 seconds before retry
+        # Retry logic for timeout issues
+        try:
+            last_error = await _retry_create_sessions(api)
+        except asyncio.CancelledError:
+            # yt-dlp won the race while the browser session was starting
+            await api.close_sessions()
+            raise
         
         # Only proceed if sessions were successfully created
-        if not session_created:
-            error_msg = f"Failed to connect to TikTok. Please check your internet connection or try using a VPN."
+        if last_error is not None:
             logger.error(f"Session creation failed: {last_error}")
-            self.error_signal.emit(error_msg)
-            return
+            raise RuntimeError(
+                "Failed to connect to TikTok. Please check your internet connection or try using a VPN."
+            )
         
         try:
             # Get video information (api.video() is NOT async, returns Video object directly)
             video_info = api.video(url=self.url)
             
-            if self.cancelled:
-                return
+            if self.cancelled or not video_info:
+                return None
             
-            if video_info:
-                # Extract data from Video object
-                try:
-                    author_id = video_info.author.uniqueId if hasattr(video_info, 'author') and hasattr(video_info.author, 'uniqueId') else "Unknown"
-                except:
-                    author_id = "Unknown"
-                
-                try:
-                    likes = video_info.statistics.diggCount if hasattr(video_info, 'statistics') and hasattr(video_info.statistics, 'diggCount') else 0
-                except:
-                    likes = 0
-                    
-                try:
-                    comments = video_info.statistics.commentCount if hasattr(video_info, 'statistics') and hasattr(video_info.statistics, 'commentCount') else 0
-                except:
-                    comments = 0
-                    
-                try:
-                    shares = video_info.statistics.shareCount if hasattr(video_info, 'statistics') and hasattr(video_info.statistics, 'shareCount') else 0
-                except:
-                    shares = 0
-                    
-                try:
-                    duration = video_info.video.duration if hasattr(video_info, 'video') and hasattr(video_info.video, 'duration') else 0
-                except:
-                    duration = 0
-                    
-                try:
-                    cover = video_info.dynamicCover if hasattr(video_info, 'dynamicCover') else ""
-                except:
-                    cover = ""
-                
-                # Format the data for display
-                formatted_info = {
-                    "title": str(video_info.desc if hasattr(video_info, 'desc') else "Unknown")[:100],
-                    "author": author_id,
-                    "likes": likes,
-                    "comments": comments,
-                    "shares": shares,
-                    "duration": duration,
-                    "cover": cover,
-                    "raw_data": video_info,
-                }
-                self.video_info_signal.emit(formatted_info)
-                logger.info(f"Video info fetched successfully")
-            else:
-                self.error_signal.emit(_("errors.could_not_fetch_video_info"))
+            # Extract data from Video object and format it for display
+            formatted_info = {name: _dig(video_info, path, default) for name, path, default in _VIDEO_INFO_FIELDS}
+            formatted_info["title"] = str(_dig(video_info, ("desc",), "Unknown"))[:100]
+            formatted_info["raw_data"] = video_info
+            logger.info(f"Video info fetched successfully with TikTokApi")
+            return formatted_info
             
         except Exception as e:
             logger.exception(f"Error in _fetch_video_async: {e}")
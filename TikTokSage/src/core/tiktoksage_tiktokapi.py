@@ -5,10 +5,13 @@ Handles TikTok API setup, downloads, and version management.
 Uses TikTokApi library for downloading TikTok videos.
 """
 
+import importlib
+import importlib.util
 import os
 import subprocess
 import tempfile
 import time
+from functools import lru_cache
 from importlib.metadata import PackageNotFoundError, version as importlib_version
 from pathlib import Path
 from typing import Optional
@@ -37,23 +40,25 @@ from src.utils.tiktoksage_constants import (
 )
 
 
+@lru_cache(maxsize=1)
 def check_tiktokapi_installed() -> bool:
     """
     Check if TikTokApi is installed.
     
+    Only the import system is asked whether the package can be found, so the
+    (Playwright-heavy) module itself is not imported here. The result is
+    memoized until install_tiktokapi() clears it.
+    
     Returns:
         True if installed, False otherwise
     """
-    try:
-        import TikTokApi
-        return True
-    except ImportError:
-        return False
+    return importlib.util.find_spec("TikTokApi") is not None
 
 
+@lru_cache(maxsize=1)
 def get_tiktokapi_version() -> str:
     """
-    Get the version of installed TikTokApi.
+    Get the version of installed TikTokApi (memoized, see check_tiktokapi_installed).
     
     Returns:
         Version string or "unknown"
@@ -79,6 +84,11 @@ def install_tiktokapi() -> bool:
             creationflags=SUBPROCESS_CREATIONFLAGS,
         )
         logger.info("TikTokApi installed successfully")
+        # Let the fresh install be found by the next (memoized) availability check
+        importlib.invalidate_caches()
+        check_tiktokapi_installed.cache_clear()
+        get_tiktokapi_version.cache_clear()
+        check_tiktokapi_binary.cache_clear()
         return True
     except subprocess.CalledProcessError as e:
         logger.error(f"Failed to install TikTokApi: {e}")
@@ -171,9 +181,13 @@ class TikTokApiInstallThread(QThread):
         self.finished.emit(success)
 
 
+@lru_cache(maxsize=1)
 def check_tiktokapi_binary() -> bool:
     """
     Check if TikTokApi is available.
+
+    The result is memoized (main.py and the main window both check at startup);
+    install_tiktokapi() clears it after a successful install.
     
     Returns:
         True if available, False otherwise
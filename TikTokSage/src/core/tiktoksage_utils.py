@@ -11,27 +11,39 @@ Provides utility functions for TikTok video handling including:
 import os
 import re
 import shutil
-import subprocess
 import sys
 import tempfile
+import threading
+import time
+from functools import lru_cache
 from importlib.metadata import PackageNotFoundError, version as importlib_version
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import requests
 from packaging import version
 
 from src.core.tiktoksage_tiktokapi import check_tiktokapi_installed
+from src.utils.tiktoksage_config_manager import ConfigManager
 from src.utils.tiktoksage_constants import (
     APP_CONFIG_FILE,
     OS_NAME,
-    SUBPROCESS_CREATIONFLAGS,
     USER_HOME_DIR,
 )
 from src.utils.tiktoksage_localization import _
 from src.utils.tiktoksage_logger import logger
 
+# Accepted TikTok URL forms (matched at the start of the URL), fused into one
+# pattern: (www.)tiktok.com/@user[/video/id] and (vt.)tiktok.com/<short link>
+_TIKTOK_URL_RE = re.compile(
+    r"(?:https?://)?(?:www\.tiktok\.com/@[\w.-]+|vt\.tiktok\.com/\w+|tiktok\.com/(?:@[\w.-]+|\w+))"
+)
+
+# Same pattern matched at the start of every line, for scanning many URLs in one pass
+_TIKTOK_URL_LINE_RE = re.compile(r"^" + _TIKTOK_URL_RE.pattern, re.MULTILINE)
+
 
+@lru_cache(maxsize=4096)
 def validate_tiktok_url(url: str) -> bool:
     """
     Validate if the URL is a valid TikTok URL.
@@ -42,21 +54,46 @@ def validate_tiktok_url(url: str) -> bool:
     Returns:
         True if valid TikTok URL, False otherwise
     """
-    tiktok_patterns = [
-        r"(?:https?://)?(?:www\.)?tiktok\.com/@[\w.-]+/video/\d+",
-        r"(?:https?://)?(?:www\.)?tiktok\.com/@[\w.-]+",
-        r"(?:https?://)?(?:vt\.)?tiktok\.com/[\w]+",  # Short links
-    ]
+    return _TIKTOK_URL_RE.match(url) is not None
+
+
+def validate_tiktok_urls(urls: List[str]) -> List[bool]:
+    """
+    Validate many URLs at once (see validate_tiktok_url).
     
-    for pattern in tiktok_patterns:
-        if re.match(pattern, url):
-            return True
-    return False
+    The URLs are joined into one newline-separated buffer that the regex engine
+    scans in a single pass, instead of one Python-level match call per URL.
+    
+    Args:
+        urls: URLs to validate
+    
+    Returns:
+        One flag per URL, True if it is a valid TikTok URL
+    """
+    # A URL spanning several lines would break the one-URL-per-line scan
+    if any("\n" in url for url in urls):
+        return [validate_tiktok_url(url) for url in urls]
+    
+    # Offset of each URL in the joined buffer -> its position in the list
+    line_index = {}
+    offset = 0
+    for i, url in enumerate(urls):
+        line_index[offset] = i
+        offset += len(url) + 1
+    
+    valid = [False] * len(urls)
+    for match in _TIKTOK_URL_LINE_RE.finditer("\n".join(urls)):
+        valid[line_index[match.start()]] = True
+    return valid
+
+# Download path as last loaded or saved; only load_saved_path/save_path use the config key
+_cached_download_path: Optional[str] = None
+_download_path_lock = threading.Lock()
 
 
 def load_saved_path(parent_widget=None) -> Optional[str]:
     """
-    Load the saved download path from config.
+    Load the saved download path from config (read once, then kept by save_path).
     
     Args:
         parent_widget: Parent widget to attach to (optional)
@@ -64,8 +101,16 @@ def load_saved_path(parent_widget=None) -> Optional[str]:
     Returns:
         The saved download path or None
     """
+    global _cached_download_path
+    with _download_path_lock:
+        if _cached_download_path is None:
+            _cached_download_path = _read_saved_path()
+        return _cached_download_path
+
+
+def _read_saved_path() -> str:
+    """Read the download path from config, falling back to ~/Downloads."""
     try:
-        from src.utils.tiktoksage_config_manager import ConfigManager
         saved_path = ConfigManager.get("download_path")
         if saved_path:
             return saved_path
@@ -82,37 +127,35 @@ def save_path(path: str) -> None:
     Args:
         path: Path to save
     """
-    try:
-        from src.utils.tiktoksage_config_manager import ConfigManager
-        ConfigManager.set("download_path", path)
-    except Exception as e:
-        logger.error(f"Error saving path: {e}")
+    global _cached_download_path
+    with _download_path_lock:
+        try:
+            ConfigManager.set("download_path", path)
+            _cached_download_path = path
+        except Exception as e:
+            logger.error(f"Error saving path: {e}")
 
 
+@lru_cache(maxsize=1)
 def check_ffmpeg() -> bool:
     """
-    Check if FFmpeg is available on the system.
+    Check if FFmpeg is available on the system (checked once per session).
+    
+    Only PATH is searched for the executable; FFmpeg itself is not run.
     
     Returns:
         True if FFmpeg is available, False otherwise
     """
-    try:
-        result = subprocess.run(
-            ["ffmpeg", "-version"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            creationflags=SUBPROCESS_CREATIONFLAGS,
-            timeout=5,
-        )
-        return result.returncode == 0
-    except Exception as e:
-        logger.debug(f"FFmpeg check failed: {e}")
-        return False
+    ffmpeg_path = shutil.which("ffmpeg")
+    if ffmpeg_path is None:
+        logger.debug("FFmpeg not found on PATH")
+    return ffmpeg_path is not None
 
 
+@lru_cache(maxsize=None)
 def get_version(package_name: str) -> str:
     """
-    Get the version of a package.
+    Get the version of a package (looked up once per package and session).
     
     Args:
         package_name: Name of the package
@@ -127,6 +170,19 @@ def get_version(package_name: str) -> str:
         return "unknown"
 
 
+# Common error patterns and the localization keys of their messages
+_ERROR_KEYS = {
+    "rate limit": "errors.rate_limit",
+    "unauthorized": "errors.unauthorized",
+    "forbidden": "errors.forbidden",
+    "not found": "errors.not_found",
+    "private": "errors.private_video",
+    "age restricted": "errors.age_restricted",
+    "removed": "errors.removed_video",
+}
+_ERROR_RE = re.compile("(" + "|".join(map(re.escape, _ERROR_KEYS)) + ")", re.IGNORECASE)
+
+
 def parse_tiktok_error(error_output: str) -> str:
     """
     Parse TikTok API error messages and return user-friendly messages.
@@ -137,44 +193,54 @@ def parse_tiktok_error(error_output: str) -> str:
     Returns:
         User-friendly error message
     """
-    error_lower = error_output.lower()
-    
-    # Common error patterns
-    error_patterns = {
-        "rate limit": _("errors.rate_limit"),
-        "unauthorized": _("errors.unauthorized"),
-        "forbidden": _("errors.forbidden"),
-        "not found": _("errors.not_found"),
-        "private": _("errors.private_video"),
-        "age restricted": _("errors.age_restricted"),
-        "removed": _("errors.removed_video"),
-    }
-    
-    for pattern, message in error_patterns.items():
-        if pattern in error_lower:
-            return message
+    match = _ERROR_RE.search(error_output)
+    if match:
+        return _(_ERROR_KEYS[match.group(1).lower()])
     
     return _("errors.unknown_error")
 
 
+# Interval between auto-update checks (seconds)
+AUTO_UPDATE_INTERVAL = 24 * 3600
+
+# How long the answer of should_check_for_auto_update is reused before the config is read again (seconds)
+AUTO_UPDATE_CACHE_TTL = 300
+
+# (time computed, answer) of the last should_check_for_auto_update call
+_auto_update_cache: Optional[Tuple[float, bool]] = None
+
+
 def should_check_for_auto_update() -> bool:
     """
     Check if we should check for auto-updates.
     
+    The answer is reused for AUTO_UPDATE_CACHE_TTL seconds; call
+    invalidate_auto_update_cache() after recording a new check.
+    
     Returns:
         True if auto-update checking is enabled, False otherwise
     """
+    global _auto_update_cache
+    now = time.time()
+    if _auto_update_cache and now - _auto_update_cache[0] < AUTO_UPDATE_CACHE_TTL:
+        return _auto_update_cache[1]
+    
     try:
-        from src.utils.tiktoksage_config_manager import ConfigManager
-        import time
-        
         last_check = ConfigManager.get("cached_versions.tiktokapi.last_check", 0)
-        current_time = time.time()
         
         # Check every 24 hours
-        return (current_time - last_check) > (24 * 3600)
+        due = (now - last_check) > AUTO_UPDATE_INTERVAL
     except Exception:
         return False
+    
+    _auto_update_cache = (now, due)
+    return due
+
+
+def invalidate_auto_update_cache() -> None:
+    """Forget the cached should_check_for_auto_update answer so the next call re-reads the config."""
+    global _auto_update_cache
+    _auto_update_cache = None
 
 
 def is_channel_url(url: str) -> bool:
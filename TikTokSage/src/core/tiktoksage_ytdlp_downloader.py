@@ -7,19 +7,47 @@ Works around TikTok's anti-bot protection better than Playwright.
 
 import os
 import json
+import subprocess
+import sys
+import threading
+from collections import deque
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Callable, Dict, Optional, Tuple
 
 try:
     import yt_dlp
 except ImportError:
     yt_dlp = None
 
+from src.utils.tiktoksage_constants import SUBPROCESS_CREATIONFLAGS
 from src.utils.tiktoksage_logger import logger
 from src.utils.tiktoksage_localization import LocalizationManager
 
 _ = LocalizationManager.get_text
 
+# yt-dlp options for video and audio-only downloads; download_video() copies
+# one and adds the output template and progress hooks
+_YDL_OPTS_VIDEO = {
+    'format': 'best[ext=mp4]',
+    'quiet': False,
+    'no_warnings': False,
+    'socket_timeout': 30,
+}
+_YDL_OPTS_AUDIO = {
+    **_YDL_OPTS_VIDEO,
+    'format': 'bestaudio[ext=m4a]',
+    'postprocessors': [{
+        'key': 'FFmpegExtractAudio',
+        'preferredcodec': 'm4a',
+        'preferredquality': '192',
+    }],
+}
+
+# Output directories already created by this process (skips the mkdir syscalls
+# when a downloader is created per video; yt-dlp recreates a deleted directory)
+_known_dirs = set()
+_known_dirs_lock = threading.Lock()
+
 
 class YtDlpDownloader:
     """TikTok downloader using yt-dlp library."""
@@ -34,8 +62,50 @@ class YtDlpDownloader:
         if yt_dlp is None:
             raise ImportError("yt-dlp is not installed. Install it with: pip install yt-dlp")
         
+        # YoutubeDL instances are reused across calls (creating one loads the
+        # extractors and sets up cookies and the HTTP session); they are not
+        # thread-safe, so each call holds the lock while using one
+        self._ydl_lock = threading.Lock()
+        self._info_ydl = None
+        self._download_ydls: Dict[Tuple[bool, bool], "yt_dlp.YoutubeDL"] = {}
+        
         self.output_path = Path(output_path) if output_path else Path.cwd()
-        self.output_path.mkdir(parents=True, exist_ok=True)
+        dir_key = os.fspath(self.output_path)
+        with _known_dirs_lock:
+            if dir_key not in _known_dirs:
+                self.output_path.mkdir(parents=True, exist_ok=True)
+                _known_dirs.add(dir_key)
+    
+    @property
+    def output_path(self) -> Path:
+        """Directory to save videos."""
+        return self._output_path
+    
+    @output_path.setter
+    def output_path(self, value) -> None:
+        self._output_path = Path(value)
+        # yt-dlp output template, built once instead of on every download
+        self._output_template = os.path.join(os.fspath(self._output_path), '%(title)s.%(ext)s')
+        # Cached downloaders were created with the previous output template
+        with self._ydl_lock:
+            for ydl in self._download_ydls.values():
+                ydl.close()
+            self._download_ydls.clear()
+    
+    def close(self) -> None:
+        """Close the cached YoutubeDL instances."""
+        with self._ydl_lock:
+            for ydl in [self._info_ydl, *self._download_ydls.values()]:
+                if ydl is not None:
+                    ydl.close()
+            self._info_ydl = None
+            self._download_ydls.clear()
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
     
     def get_video_info(self, url: str) -> Optional[Dict]:
         """
@@ -48,14 +118,15 @@ class YtDlpDownloader:
             Dictionary with video info or None if failed
         """
         try:
-            ydl_opts = {
-                'quiet': True,
-                'no_warnings': True,
-                'extract_flat': True,
-            }
-            
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
+            with self._ydl_lock:
+                if self._info_ydl is None:
+                    ydl_opts = {
+                        'quiet': True,
+                        'no_warnings': True,
+                        'extract_flat': True,
+                    }
+                    self._info_ydl = yt_dlp.YoutubeDL(ydl_opts)
+                info = self._info_ydl.extract_info(url, download=False)
             
             if info:
                 return {
@@ -88,28 +159,18 @@ class YtDlpDownloader:
             Tuple of (success: bool, filepath: str)
         """
         try:
-            output_template = str(self.output_path / '%(title)s.%(ext)s')
-            
-            ydl_opts = {
-                'format': 'best[ext=mp4]' if not audio_only else 'best[ext=m4a]',
-                'outtmpl': output_template,
-                'quiet': False,
-                'no_warnings': False,
-                'progress_hooks': [self._progress_hook] if progress_callback else [],
-                'socket_timeout': 30,
-            }
-            
-            if audio_only:
-                ydl_opts['format'] = 'bestaudio[ext=m4a]'
-                ydl_opts['postprocessors'] = [{
-                    'key': 'FFmpegExtractAudio',
-                    'preferredcodec': 'm4a',
-                    'preferredquality': '192',
-                }]
-            
             logger.info(f"Starting yt-dlp download: {url}")
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            # The options only vary with these two arguments (the output path is per instance)
+            key = (audio_only, bool(progress_callback))
+            with self._ydl_lock:
+                ydl = self._download_ydls.get(key)
+                if ydl is None:
+                    ydl_opts = (_YDL_OPTS_AUDIO if audio_only else _YDL_OPTS_VIDEO).copy()
+                    ydl_opts['outtmpl'] = self._output_template
+                    if progress_callback:
+                        ydl_opts['progress_hooks'] = [self._progress_hook]
+                    ydl = self._download_ydls[key] = yt_dlp.YoutubeDL(ydl_opts)
                 info = ydl.extract_info(url, download=True)
                 filepath = ydl.prepare_filename(info)
             
@@ -138,30 +199,53 @@ def is_ytdlp_available() -> bool:
         return False
 
 
-def install_ytdlp() -> bool:
+def install_ytdlp(output_callback: Optional[Callable[[str], None]] = None, timeout: float = 60) -> bool:
     """
     Attempt to install yt-dlp using pip.
     
+    pip's output is streamed line by line as it is produced instead of being
+    buffered until pip exits, so a caller can show installation progress.
+    
+    Args:
+        output_callback: Callable(line) called for each line of pip output
+        timeout: Seconds after which pip is killed and the installation fails
+    
     Returns:
         True if installation successful, False otherwise
     """
     try:
-        import subprocess
-        import sys
-        
         logger.info("Installing yt-dlp...")
-        result = subprocess.run(
+        process = subprocess.Popen(
             [sys.executable, "-m", "pip", "install", "yt-dlp"],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=60
+            bufsize=1,
+            creationflags=SUBPROCESS_CREATIONFLAGS,
         )
         
-        if result.returncode == 0:
+        # Reading stdout blocks, so the timeout is enforced by killing pip
+        watchdog = threading.Timer(timeout, process.kill)
+        watchdog.start()
+        tail = deque(maxlen=20)  # Last lines, reported if pip fails
+        try:
+            for line in process.stdout:
+                line = line.rstrip()
+                tail.append(line)
+                logger.debug("pip: {}", line)
+                if output_callback:
+                    output_callback(line)
+            returncode = process.wait()
+        finally:
+            watchdog.cancel()
+            process.stdout.close()
+        
+        if returncode == 0:
             logger.info("yt-dlp installed successfully")
             return True
         else:
-            logger.error(f"yt-dlp installation failed: {result.stderr}")
+            output = "\n".join(tail)
+            logger.error(f"yt-dlp installation failed: {output}")
             return False
             
     except Exception as e:
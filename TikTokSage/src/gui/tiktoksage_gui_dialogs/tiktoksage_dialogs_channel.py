@@ -4,15 +4,21 @@ Channel Videos Selection Dialog
 Dialog for selecting videos to download from a TikTok channel.
 """
 
-from PySide6.QtCore import Qt, Signal, QThread
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+from typing import List, Tuple
+
+from PySide6.QtCore import Qt, Signal, QThread, QTimer, QAbstractListModel, QModelIndex
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
     QPushButton,
-    QListWidget,
-    QListWidgetItem,
+    QAbstractItemView,
+    QListView,
     QMessageBox,
     QProgressBar,
     QFrame,
@@ -21,42 +27,233 @@ from PySide6.QtWidgets import (
 )
 
 from src.gui.tiktoksage_gui_dialogs.tiktoksage_dialogs_base import BaseTikTokDialog
-from src.core.tiktoksage_channel_downloader import get_channel_videos
+from src.core.tiktoksage_channel_cache import load_cached
+from src.core.tiktoksage_channel_downloader import (
+    enrich_videos, get_channel_videos, save_enriched_videos, update_channel_cache,
+)
 from src.utils.tiktoksage_logger import logger
 
+# Item data roles served by ChannelVideosModel.data(), which runs for every painted
+# row: bound once here instead of resolving the nested Qt enums on each call
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_USER_ROLE = Qt.ItemDataRole.UserRole
+
+# Style sheet of the channel dialog, applied once on the dialog itself. Widgets are
+# selected by object name, so building the dialog parses a single style sheet
+# instead of one per widget. (Not installed on the QApplication: the main window's
+# own style sheet is inherited by the dialog and would take precedence over it.)
+CHANNEL_DIALOG_QSS = """
+    #headerFrame {
+        background-color: #252525;
+        border: 1px solid #404040;
+        border-radius: 8px;
+        padding: 10px;
+    }
+    #titleLabel {
+        font-size: 16px;
+        font-weight: bold;
+        color: #4a9eff;
+    }
+    #channelLabel, #selectionLabel {
+        color: #aaaaaa;
+        font-size: 11px;
+    }
+    #infoLabel {
+        font-weight: bold;
+        color: #ffffff;
+        padding-top: 5px;
+    }
+    QProgressBar#channelProgressBar {
+        border: 1px solid #404040;
+        border-radius: 4px;
+        background-color: #1a1a1a;
+        height: 8px;
+        text-align: center;
+    }
+    QProgressBar#channelProgressBar::chunk {
+        background-color: #4a9eff;
+        border-radius: 4px;
+    }
+    QGroupBox#videosGroup {
+        background-color: #2a2a2a;
+        border: 1px solid #404040;
+        border-radius: 8px;
+        margin-top: 10px;
+        font-weight: bold;
+        color: #ffffff;
+        padding-top: 10px;
+    }
+    QGroupBox#videosGroup::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 8px;
+        color: #4a9eff;
+    }
+    QListView#videosList {
+        background-color: #1a1a1a;
+        border: 1px solid #505050;
+        border-radius: 6px;
+        color: #ffffff;
+        padding: 5px;
+        outline: none;
+    }
+    QListView#videosList::item {
+        background-color: #2d2d2d;
+        border: 1px solid #404040;
+        border-radius: 4px;
+        padding: 8px 10px;
+        margin: 2px 0px;
+        color: #ffffff;
+    }
+    QListView#videosList::item:hover {
+        background-color: #3a3a3a;
+        border-color: #4a9eff;
+    }
+    QListView#videosList::item:selected {
+        background-color: #0066cc;
+        border-color: #4a9eff;
+    }
+    QListView#videosList::item:selected:hover {
+        background-color: #0077dd;
+    }
+    QFrame#buttonsFrame {
+        background-color: #252525;
+        border: 1px solid #404040;
+        border-radius: 8px;
+    }
+    #buttonsFrame QPushButton {
+        background-color: #3a3a3a;
+        color: #ffffff;
+        border: 1px solid #505050;
+        border-radius: 5px;
+        padding: 8px 16px;
+        font-weight: 500;
+        min-width: 90px;
+    }
+    #buttonsFrame QPushButton:hover {
+        background-color: #4a4a4a;
+        border-color: #4a9eff;
+    }
+    #buttonsFrame QPushButton:pressed {
+        background-color: #505050;
+    }
+    #buttonsFrame QPushButton#downloadBtn {
+        background-color: #0066cc;
+        border-color: #0066cc;
+        color: white;
+        font-weight: bold;
+    }
+    #buttonsFrame QPushButton#downloadBtn:hover {
+        background-color: #0077dd;
+        border-color: #4a9eff;
+    }
+    #buttonsFrame QPushButton#downloadBtn:disabled {
+        background-color: #404040;
+        border-color: #505050;
+        color: #888888;
+    }
+"""
+
+# Minimum time between two progress bar repaints (seconds, ~60 Hz)
+PROGRESS_REPAINT_INTERVAL = 0.016
+
+# A cached listing younger than this is shown without refreshing it from TikTok (seconds);
+# an older one is shown at once while its newest videos load in the background
+CHANNEL_REFRESH_AGE = 3600
+
+# Newest videos fetched to refresh an old cached listing (see update_channel_cache)
+CHANNEL_REFRESH_VIDEOS = 30
+
+# How long closing the dialog waits for a cancelled loader thread to finish (ms)
+LOADER_STOP_TIMEOUT = 2000
+
+# Interval at which the dialog collects the videos found by the loader thread (ms)
+FOUND_VIDEOS_POLL_INTERVAL = 100
+
+# Loader threads still running after their dialog closed, by id(). They are
+# referenced here until deleted after finishing: a QThread destroyed while
+# running aborts the process
+_stopping_loaders = {}
+
+
+@lru_cache(maxsize=4096)
+def _format_duration(duration) -> str:
+    """Format a duration in seconds as m:ss ("N/A" if unknown); durations repeat a lot."""
+    duration = int(duration or 0)
+    if not duration:
+        return "N/A"
+    minutes, seconds = divmod(duration, 60)
+    return f"{minutes}:{seconds:02d}"
+
+
+def _video_row(video: dict) -> Tuple[str, str, str]:
+    """Prepare the (title, formatted duration, URL) fields a list row shows for a video."""
+    return video.get('title', 'Unknown'), _format_duration(video.get('duration')), video.get('url')
+
 
 class ChannelVideosLoaderThread(QThread):
     """Background thread for loading channel videos with real-time updates."""
     
     progress_signal = Signal(str)  # Progress message
-    video_found_signal = Signal(dict)  # Emitted for each video found
+    video_updated_signal = Signal(int, dict)  # (index, video) - emitted when missing metadata was fetched
     progress_percent_signal = Signal(int, int)  # (current, total) - 0 total means unknown
     finished_signal = Signal(list)
     
-    def __init__(self, channel_url: str, max_videos: int = 50):
+    def __init__(self, channel_url: str, max_videos: int = 50, force_refresh: bool = False,
+                 update_cache: bool = False):
         super().__init__()
         self.channel_url = channel_url
         self.max_videos = max_videos
+        self.force_refresh = force_refresh
+        self.update_cache = update_cache  # Only fetch the newest videos of a cached channel
         self.videos = []
-        self._is_running = True
+        # Set by stop(); checked by the callbacks and by the channel listing itself
+        self._cancel_event = threading.Event()
+        self._seen_urls = set()  # URLs already in self.videos
+        # (video, row) pairs not collected by the dialog yet (see take_found_videos);
+        # queued without a signal so a fast listing costs no cross-thread events
+        self._found = deque()
+        self._found_lock = threading.Lock()
     
     def stop(self):
-        """Stop the loading thread."""
-        self._is_running = False
+        """Stop the loading thread (also cancels the running yt-dlp listing)."""
+        self._cancel_event.set()
     
     def video_callback(self, video_info: dict):
         """Called for each video as it's fetched."""
-        if not self._is_running:
+        if self._cancel_event.is_set():
+            return
+        # Retried or overlapping pages may repeat videos: keep the first of each URL
+        url = video_info.get('url')
+        if not url or url in self._seen_urls:
             return
+        self._seen_urls.add(url)
         self.videos.append(video_info)
-        self.video_found_signal.emit(video_info)
+        # The row fields are prepared here so the GUI thread only inserts them
+        row = _video_row(video_info)
+        with self._found_lock:
+            self._found.append((video_info, row))
+    
+    def take_found_videos(self) -> list:
+        """Return the (video, row) pairs found since the last call (called from the GUI thread)."""
+        with self._found_lock:
+            found = list(self._found)
+            self._found.clear()
+        return found
     
     def progress_callback(self, total: int, current: int):
         """Called to update progress."""
-        if not self._is_running:
+        if self._cancel_event.is_set():
             return
         self.progress_percent_signal.emit(current, total)
     
+    def video_updated_callback(self, index: int, video_info: dict):
+        """Called for each video whose missing metadata was fetched."""
+        if self._cancel_event.is_set():
+            return
+        self.videos[index] = video_info
+        self.video_updated_signal.emit(index, video_info)
+    
     def run(self):
         """Load videos in background with streaming."""
         try:
@@ -65,25 +262,44 @@ class ChannelVideosLoaderThread(QThread):
             # Get channel videos with real-time callbacks
             self.progress_signal.emit("📥 Fetching videos...")
             
-            videos = get_channel_videos(
-                self.channel_url, 
-                max_videos=self.max_videos,
-                progress_callback=self.progress_callback,
-                video_callback=self.video_callback
-            )
-            
-            # Collect any remaining videos from generator
-            if hasattr(videos, '__iter__') and not isinstance(videos, list):
-                for video in videos:
-                    if not self._is_running:
-                        break
-                    self.videos.append(video)
-                    self.video_found_signal.emit(video)
-            else:
-                self.videos = videos if videos else []
+            # self.videos is filled by video_callback as the videos stream in
+            merged = None
+            if self.update_cache:
+                merged = update_channel_cache(
+                    self.channel_url,
+                    max_new=CHANNEL_REFRESH_VIDEOS,
+                    progress_callback=self.progress_callback,
+                    video_callback=self.video_callback,
+                    cancel_event=self._cancel_event,
+                )
+            if merged is not None:
+                # The newest videos are listed; add the cached ones after them
+                for video_info in merged:
+                    self.video_callback(video_info)
+            elif not self._cancel_event.is_set():
+                get_channel_videos(
+                    self.channel_url, 
+                    max_videos=self.max_videos,
+                    progress_callback=self.progress_callback,
+                    video_callback=self.video_callback,
+                    force_refresh=self.force_refresh or self.update_cache,
+                    cancel_event=self._cancel_event,
+                )
             
             logger.info(f"ChannelLoaderThread fetched {len(self.videos)} videos")
             
+            # Flat listings may lack titles/durations: look them up in parallel
+            if self.videos and not self._cancel_event.is_set():
+                self.progress_signal.emit("🔎 Fetching video details...")
+                enriched = enrich_videos(
+                    list(self.videos),
+                    video_callback=self.video_updated_callback,
+                    cancel_event=self._cancel_event,
+                )
+                # The listing was cached flat; keep the details for the next open
+                if enriched and not self._cancel_event.is_set():
+                    save_enriched_videos(self.channel_url, self.videos)
+            
             if self.videos:
                 self.progress_signal.emit(f"✅ Loaded {len(self.videos)} videos")
             else:
@@ -97,6 +313,67 @@ class ChannelVideosLoaderThread(QThread):
             self.finished_signal.emit(self.videos if hasattr(self, 'videos') else [])
 
 
+class ChannelVideosModel(QAbstractListModel):
+    """
+    List model of the channel videos shown in the dialog.
+
+    Each shown field is kept in its own list (titles, formatted durations, URLs)
+    and the row text is built on demand, so no per-row item objects are allocated.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._titles: List[str] = []
+        self._durations: List[str] = []
+        self._urls: List[str] = []
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._urls)
+    
+    def data(self, index, role=_DISPLAY_ROLE):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == _DISPLAY_ROLE:
+            return f"{row+1}. {self._titles[row]} ({self._durations[row]}s)"
+        if role == _USER_ROLE:
+            return self._urls[row]
+        return None
+    
+    def urls(self, rows: List[int]) -> List[str]:
+        """Return the URLs of the videos in the given rows."""
+        urls = self._urls
+        return [urls[row] for row in rows]
+    
+    def append_rows(self, rows: List[Tuple[str, str, str]]):
+        """Append rows prepared by _video_row (a single insert notification)."""
+        if not rows:
+            return
+        first = len(self._urls)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        for title, duration, url in rows:
+            self._titles.append(title)
+            self._durations.append(duration)
+            self._urls.append(url)
+        self.endInsertRows()
+    
+    def update_video(self, row: int, video: dict):
+        """Replace the title and duration shown for a row."""
+        if not 0 <= row < len(self._urls):
+            return
+        self._titles[row], self._durations[row], _ = _video_row(video)
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+    
+    def clear(self):
+        """Remove all rows."""
+        self.beginResetModel()
+        self._titles.clear()
+        self._durations.clear()
+        self._urls.clear()
+        self.endResetModel()
+
+
 class ChannelVideosDialog(BaseTikTokDialog):
     """Dialog for selecting videos from a TikTok channel."""
     
@@ -108,63 +385,121 @@ class ChannelVideosDialog(BaseTikTokDialog):
         super().__init__(parent, "Select Channel Videos")
         self.channel_url = channel_url
         self.videos = []
+        self._row_by_url = {}  # URL -> row of self.videos (the list is deduplicated by URL)
         self.selected_urls = []  # Store selected URLs
-        self._update_counter = 0  # Counter for throttling UI updates
+        self._last_progress_ts = 0.0  # Last progress bar update (see on_progress_percent)
+        self._last_pb = (None, None, None)  # Last (maximum, value, format) set on the progress bar
+        self._loader_handed_over = False  # See done(): the loader then deletes itself
+        
+        # Collects the videos found by the loader thread while it runs
+        self._found_timer = QTimer(self)
+        self._found_timer.setInterval(FOUND_VIDEOS_POLL_INTERVAL)
+        self._found_timer.timeout.connect(self.collect_found_videos)
+
         self.setMinimumSize(700, 500)
         
         logger.info(f"Initializing channel dialog for: {channel_url}")
         
         self.init_ui()
-        self.fetch_videos_async()
+        
+        # Stale-while-revalidate: show the cached listing at once, add its newest videos if old
+        cache_age = self.load_cached_videos()
+        self.fetch_videos_async(update_cache=cache_age is not None and cache_age > CHANNEL_REFRESH_AGE)
         
         logger.info("Channel dialog initialized, starting async fetch")
     
-    def fetch_videos_async(self):
+    def load_cached_videos(self):
+        """
+        List the cached videos of the channel, if any.
+        
+        Returns:
+            Age of the cached listing in seconds, or None if the channel is not cached
+        """
+        videos, mtime, _ = load_cached(self.channel_url)
+        if not videos:
+            return None
+        
+        self.add_videos(videos)
+        self.info_label.setText(f"📦 Loaded {len(self.videos)} videos from cache, checking for new videos...")
+        logger.info(f"Showing {len(self.videos)} cached videos for {self.channel_url}")
+        return time.time() - mtime
+    
+    def fetch_videos_async(self, force_refresh: bool = False, update_cache: bool = False):
         """Fetch videos in background thread with real-time updates."""
         max_videos = 0  # No limit - fetch all videos
-        self.loading_thread = ChannelVideosLoaderThread(self.channel_url, max_videos=max_videos)
+        self.loading_thread = ChannelVideosLoaderThread(
+            self.channel_url, max_videos=max_videos, force_refresh=force_refresh, update_cache=update_cache
+        )
         self.loading_thread.progress_signal.connect(self.on_loading_progress)
-        self.loading_thread.video_found_signal.connect(self.on_video_found, Qt.ConnectionType.QueuedConnection)
         self.loading_thread.progress_percent_signal.connect(self.on_progress_percent, Qt.ConnectionType.QueuedConnection)
+        self.loading_thread.video_updated_signal.connect(self.on_video_updated, Qt.ConnectionType.QueuedConnection)
         self.loading_thread.finished_signal.connect(self.on_videos_loaded)
         self.loading_thread.start()
+        self._found_timer.start()
     
-    def on_video_found(self, video: dict):
-        """Handle a video found in real-time."""
-        if video and video.get('url'):
-            self.videos.append(video)
-            self._update_counter += 1
-            
-            # Add to list widget
-            title = video.get('title', 'Unknown')
-            duration = video.get('duration', 0)
-            duration_str = f"{duration//60}:{duration%60:02d}" if duration else "N/A"
-            
-            item_text = f"{len(self.videos)}. {title} ({duration_str}s)"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.ItemDataRole.UserRole, video.get('url'))
-            self.videos_list.addItem(item)
-            
-            # Only update UI every 5 videos to reduce lag
-            if self._update_counter % 5 == 0:
-                self.videos_list.scrollToBottom()
-                self.info_label.setText(f"📥 Fetched {len(self.videos)} videos...")
-                # Force process events to keep UI responsive
-                from PySide6.QtWidgets import QApplication
-                QApplication.processEvents()
+    def collect_found_videos(self):
+        """List the videos the loader thread found since the last collection."""
+        found = self.loading_thread.take_found_videos()
+        if found:
+            videos, rows = zip(*found)
+            self.add_videos(videos, rows)
+    
+    def add_videos(self, videos, rows=None):
+        """
+        List the videos that are not listed yet (matched by URL), in one batch.
+        
+        Args:
+            videos: Video info dicts
+            rows: Their list rows as prepared by _video_row (prepared here if omitted)
+        """
+        new_rows = []
+        for i, video in enumerate(videos):
+            url = video.get('url') if video else None
+            if url and url not in self._row_by_url:
+                self._row_by_url[url] = len(self.videos)
+                self.videos.append(video)
+                new_rows.append(rows[i] if rows is not None else _video_row(video))
+        if not new_rows:
+            return
+        
+        self.videos_model.append_rows(new_rows)
+        self.videos_list.scrollToBottom()
+        self.info_label.setText(f"📥 Fetched {len(self.videos)} videos...")
+    
+    def on_video_updated(self, index: int, video: dict):
+        """Refresh a listed video once its missing metadata was fetched (matched by URL)."""
+        self.collect_found_videos()  # the row may not be collected yet
+        row = self._row_by_url.get(video.get('url'))
+        if row is None:
+            return
+        self.videos[row] = video
+        self.videos_model.update_video(row, video)
     
     def on_progress_percent(self, current: int, total: int):
-        """Handle progress percentage update."""
+        """Handle progress percentage update (throttled, the final update always gets through)."""
+        now = time.monotonic()
+        if now - self._last_progress_ts < PROGRESS_REPAINT_INTERVAL and not 0 < total <= current:
+            return
+        self._last_progress_ts = now
+        
         if total > 0:
             percent = min(100, int((current / total) * 100))
-            self.progress_bar.setMaximum(100)
-            self.progress_bar.setValue(percent)
-            self.progress_bar.setFormat(f"{current}/{total} ({percent}%)")
+            self.set_progress_bar(100, percent, f"{current}/{total} ({percent}%)")
         else:
             # Unknown total - show count only
-            self.progress_bar.setMaximum(0)
-            self.progress_bar.setValue(0)
-            self.progress_bar.setFormat(f"Fetched: {current}")
+            self.set_progress_bar(0, 0, f"Fetched: {current}")
+    
+    def set_progress_bar(self, maximum: int, value: int, fmt: str):
+        """Update the progress bar, skipping the setters whose value did not change."""
+        last_maximum, last_value, last_fmt = self._last_pb
+        if maximum != last_maximum:
+            self.progress_bar.setMaximum(maximum)
+        # A new range may have reset the value, so set it again in that case
+        if value != last_value or maximum != last_maximum:
+            self.progress_bar.setValue(value)
+        if fmt != last_fmt:
+            self.progress_bar.setFormat(fmt)
+        self._last_pb = (maximum, value, fmt)
     
     def on_loading_progress(self, message: str):
         """Handle loading progress updates."""
@@ -181,57 +516,38 @@ class ChannelVideosDialog(BaseTikTokDialog):
         elif not isinstance(videos, list):
             videos = []
         
-        self.videos = videos
+        self._found_timer.stop()
+        self.disconnect_loading_thread()  # the loader emits nothing after finishing
+        # Keeps the rows already listed (e.g. from the cache) and appends new videos
+        self.add_videos(videos)
+        videos = self.videos
         self.loading_finished.emit(len(videos) > 0, len(videos))
         
         # Finalize UI
-        self.progress_bar.setMaximum(100)
-        self.progress_bar.setValue(100)
-        self.progress_bar.setFormat("100%")
+        self.videos_list.setAlternatingRowColors(True)
+        self.set_progress_bar(100, 100, "100%")
         
         if videos:
             self.info_label.setText(f"✅ Found {len(videos)} videos - Select videos to download")
             logger.info(f"All {len(videos)} videos loaded successfully")
         else:
             self.info_label.setText("❌ No videos found")
-            QMessageBox.warning(self, "Error", "Failed to load videos from channel")
-    
-    def populate_videos_list(self):
-        """Populate the videos list with loaded videos."""
-        if not self.videos:
-            logger.warning("No videos to populate")
-            return
-        
-        logger.info(f"Populating {len(self.videos)} videos in list widget")
-        
-        # Clear existing items
-        self.videos_list.clear()
-        
-        # Add videos to list
-        for i, video in enumerate(self.videos):
-            title = video.get('title', 'Unknown')
-            duration = video.get('duration', 0)
-            duration_str = f"{duration//60}:{duration%60:02d}" if duration else "N/A"
-            
-            item_text = f"{i+1}. {title} ({duration_str}s)"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.ItemDataRole.UserRole, video.get('url'))
-            self.videos_list.addItem(item)
-        
-        logger.info(f"Added {len(self.videos)} items to list widget")
-        
-        # Update progress bar
-        self.progress_bar.setMaximum(100)
-        self.progress_bar.setValue(100)
-        self.progress_bar.setVisible(False)
-        
-        # Force UI update
-        self.videos_list.update()
-        self.update()
+            QMessageBox.warning(
+                self,
+                "No Videos Found",
+                f"Could not fetch videos from {self.channel_url}\n\n"
+                "This might be due to:\n"
+                "- Private/restricted channel\n"
+                "- Network issues\n"
+                "- yt-dlp version incompatibility\n\n"
+                "Make sure you have the latest yt-dlp installed:\n"
+                "pip install --upgrade yt-dlp"
+            )
     
     def init_ui(self):
         """Initialize UI with organized sections using frames."""
         self.setMinimumSize(750, 550)
+        self.setStyleSheet(CHANNEL_DIALOG_QSS)
         
         # Main layout with padding
         main_layout = QVBoxLayout()
@@ -241,161 +557,67 @@ class ChannelVideosDialog(BaseTikTokDialog):
         # ========== HEADER SECTION ==========
         header_frame = QFrame()
         header_frame.setObjectName("headerFrame")
-        header_frame.setStyleSheet("""
-            #headerFrame {
-                background-color: #252525;
-                border: 1px solid #404040;
-                border-radius: 8px;
-                padding: 10px;
-            }
-        """)
         header_layout = QVBoxLayout(header_frame)
         header_layout.setSpacing(8)
         header_layout.setContentsMargins(12, 12, 12, 12)
         
         # Title
         title_label = QLabel(f"📺 Channel Videos")
-        title_label.setStyleSheet("font-size: 16px; font-weight: bold; color: #4a9eff;")
+        title_label.setObjectName("titleLabel")
         header_layout.addWidget(title_label)
         
         # Channel URL info
         channel_label = QLabel(f"Channel: {self.channel_url}")
-        channel_label.setStyleSheet("color: #aaaaaa; font-size: 11px;")
+        channel_label.setObjectName("channelLabel")
         channel_label.setWordWrap(True)
         header_layout.addWidget(channel_label)
         
         # Status label with icon
         self.info_label = QLabel("⏳ Loading videos from channel...")
-        self.info_label.setStyleSheet("font-weight: bold; color: #ffffff; padding-top: 5px;")
+        self.info_label.setObjectName("infoLabel")
         header_layout.addWidget(self.info_label)
         
         # Progress bar in header
         self.progress_bar = QProgressBar()
+        self.progress_bar.setObjectName("channelProgressBar")
         self.progress_bar.setMaximum(0)  # Indeterminate progress
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #404040;
-                border-radius: 4px;
-                background-color: #1a1a1a;
-                height: 8px;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background-color: #4a9eff;
-                border-radius: 4px;
-            }
-        """)
         header_layout.addWidget(self.progress_bar)
         
         main_layout.addWidget(header_frame)
         
         # ========== VIDEOS LIST SECTION ==========
         videos_group = QGroupBox("🎬 Available Videos")
-        videos_group.setStyleSheet("""
-            QGroupBox {
-                background-color: #2a2a2a;
-                border: 1px solid #404040;
-                border-radius: 8px;
-                margin-top: 10px;
-                font-weight: bold;
-                color: #ffffff;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 8px;
-                color: #4a9eff;
-            }
-        """)
+        videos_group.setObjectName("videosGroup")
         videos_layout = QVBoxLayout(videos_group)
         videos_layout.setContentsMargins(10, 15, 10, 10)
         
-        # Videos list with improved styling
-        self.videos_list = QListWidget()
-        self.videos_list.setStyleSheet("""
-            QListWidget {
-                background-color: #1a1a1a;
-                border: 1px solid #505050;
-                border-radius: 6px;
-                color: #ffffff;
-                padding: 5px;
-                outline: none;
-            }
-            QListWidget::item {
-                background-color: #2d2d2d;
-                border: 1px solid #404040;
-                border-radius: 4px;
-                padding: 8px 10px;
-                margin: 2px 0px;
-                color: #ffffff;
-            }
-            QListWidget::item:hover {
-                background-color: #3a3a3a;
-                border-color: #4a9eff;
-            }
-            QListWidget::item:selected {
-                background-color: #0066cc;
-                border-color: #4a9eff;
-            }
-            QListWidget::item:selected:hover {
-                background-color: #0077dd;
-            }
-        """)
-        self.videos_list.setSelectionMode(QListWidget.SelectionMode.MultiSelection)
-        self.videos_list.setAlternatingRowColors(True)
+        # Videos list with improved styling (rows come from the model)
+        self.videos_model = ChannelVideosModel(self)
+        self.videos_list = QListView()
+        self.videos_list.setModel(self.videos_model)
+        self.videos_list.setObjectName("videosList")
+        self.videos_list.setSelectionMode(QAbstractItemView.SelectionMode.MultiSelection)
+        # Alternating row colors are only enabled once loading finished (see
+        # on_videos_loaded): while rows stream in they repaint the whole viewport
+        # All rows are single-line: let the view skip per-row size hints and lay out in batches
+        self.videos_list.setUniformItemSizes(True)
+        self.videos_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.videos_list.setBatchSize(100)
         videos_layout.addWidget(self.videos_list)
         
         # Selection count label
         self.selection_label = QLabel("Selected: 0 videos")
-        self.selection_label.setStyleSheet("color: #aaaaaa; font-size: 11px;")
+        self.selection_label.setObjectName("selectionLabel")
         videos_layout.addWidget(self.selection_label)
         
         # Connect selection changed
-        self.videos_list.itemSelectionChanged.connect(self.on_selection_changed)
+        self.videos_list.selectionModel().selectionChanged.connect(self.on_selection_changed)
         
         main_layout.addWidget(videos_group, stretch=1)
         
         # ========== BUTTONS SECTION ==========
         buttons_frame = QFrame()
-        buttons_frame.setStyleSheet("""
-            QFrame {
-                background-color: #252525;
-                border: 1px solid #404040;
-                border-radius: 8px;
-            }
-            QPushButton {
-                background-color: #3a3a3a;
-                color: #ffffff;
-                border: 1px solid #505050;
-                border-radius: 5px;
-                padding: 8px 16px;
-                font-weight: 500;
-                min-width: 90px;
-            }
-            QPushButton:hover {
-                background-color: #4a4a4a;
-                border-color: #4a9eff;
-            }
-            QPushButton:pressed {
-                background-color: #505050;
-            }
-            QPushButton#downloadBtn {
-                background-color: #0066cc;
-                border-color: #0066cc;
-                color: white;
-                font-weight: bold;
-            }
-            QPushButton#downloadBtn:hover {
-                background-color: #0077dd;
-                border-color: #4a9eff;
-            }
-            QPushButton#downloadBtn:disabled {
-                background-color: #404040;
-                border-color: #505050;
-                color: #888888;
-            }
-        """)
+        buttons_frame.setObjectName("buttonsFrame")
         buttons_layout = QHBoxLayout(buttons_frame)
         buttons_layout.setSpacing(10)
         buttons_layout.setContentsMargins(12, 12, 12, 12)
@@ -433,67 +655,29 @@ class ChannelVideosDialog(BaseTikTokDialog):
         
         self.setLayout(main_layout)
     
+    def selected_rows(self) -> List[int]:
+        """
+        Return the selected rows in list order.
+
+        Rows are read from the selection ranges, so selecting all videos does not
+        allocate one QModelIndex per row.
+        """
+        rows = set()
+        for selection_range in self.videos_list.selectionModel().selection():
+            rows.update(range(selection_range.top(), selection_range.bottom() + 1))
+        return sorted(rows)
+    
     def on_selection_changed(self):
         """Update selection count label."""
-        count = len(self.videos_list.selectedItems())
+        # Selection ranges never overlap (QItemSelection merges them), so the
+        # count is O(ranges): a select-all is a single range however long the list
+        count = sum(selection_range.height() for selection_range in self.videos_list.selectionModel().selection())
         self.selection_label.setText(f"Selected: {count} video{'s' if count != 1 else ''}")
         self.download_btn.setEnabled(count > 0)
     
-    def fetch_videos(self):
-        """Fetch videos from the channel."""
-        try:
-            # Fetch with no limit - yt-dlp will crawl entire profile
-            self.videos = get_channel_videos(self.channel_url, max_videos=0)
-            
-            if not self.videos:
-                QMessageBox.warning(
-                    self,
-                    "No Videos Found",
-                    f"Could not fetch videos from {self.channel_url}\n\n"
-                    "This might be due to:\n"
-                    "- Private/restricted channel\n"
-                    "- Network issues\n"
-                    "- yt-dlp version incompatibility\n\n"
-                    "Make sure you have the latest yt-dlp installed:\n"
-                    "pip install --upgrade yt-dlp"
-                )
-                self.reject()
-                return
-            
-            # Populate list with all videos
-            for i, video in enumerate(self.videos):
-                title = video.get('title', 'Unknown')
-                duration = video.get('duration', 0)
-                duration_str = f"{duration//60}:{duration%60:02d}" if duration else "N/A"
-                
-                item_text = f"{i+1}. {title} ({duration_str}s)"
-                item = QListWidgetItem(item_text)
-                item.setData(Qt.ItemDataRole.UserRole, video.get('url'))
-                self.videos_list.addItem(item)
-            
-            self.progress_bar.setMaximum(100)
-            self.progress_bar.setValue(100)
-            self.progress_bar.setVisible(False)
-            
-            info_text = f"✅ Found {len(self.videos)} videos from channel"
-            # Update info label
-            for widget in self.children():
-                if isinstance(widget, QLabel) and "Loading" in widget.text():
-                    widget.setText(info_text)
-                    widget.setStyleSheet("font-weight: bold; color: #00ff00;")
-                    break
-            
-            logger.info(f"Channel dialog loaded: {len(self.videos)} videos")
-            
-        except Exception as e:
-            logger.error(f"Error fetching channel videos: {e}")
-            QMessageBox.critical(self, "Error", f"Failed to fetch videos: {e}")
-            self.reject()
-    
     def select_all_videos(self):
         """Select all videos in the list."""
-        for i in range(self.videos_list.count()):
-            self.videos_list.item(i).setSelected(True)
+        self.videos_list.selectAll()
     
     def deselect_all_videos(self):
         """Deselect all videos in the list."""
@@ -501,18 +685,65 @@ class ChannelVideosDialog(BaseTikTokDialog):
     
     def on_download(self):
         """Handle download button click."""
-        selected_items = self.videos_list.selectedItems()
+        selected_rows = self.selected_rows()
         
-        if not selected_items:
+        if not selected_rows:
             QMessageBox.warning(self, "No Selection", "Please select at least one video to download")
             return
         
-        # Extract URLs from selected items
-        self.selected_urls = [item.data(Qt.ItemDataRole.UserRole) for item in selected_items]
+        # Extract URLs from selected rows (stored for later retrieval, emitted as the same list)
+        self.selected_urls = self.videos_model.urls(selected_rows)
         
         logger.info(f"User selected {len(self.selected_urls)} videos to download")
-        logger.debug(f"Selected URLs: {self.selected_urls}")
+        logger.opt(lazy=True).debug("Selected URLs: {}", lambda: ", ".join(self.selected_urls))
         
-        # Store for later retrieval
         self.videos_selected.emit(self.selected_urls)
         self.accept()
+    
+    def done(self, result):
+        """Cancel a still-running channel listing when the dialog closes."""
+        self._found_timer.stop()
+        if self._loader_handed_over:
+            # Already closed once; the thread may be deleted by now
+            super().done(result)
+            return
+        
+        thread = self.loading_thread
+        if thread.isRunning():
+            thread.stop()
+            # The listing checks the event between videos; don't leave the thread orphaned
+            if not thread.wait(LOADER_STOP_TIMEOUT):
+                logger.warning("Channel loader thread still running after cancellation")
+                # Hook up finished -> deleteLater before dropping this dialog's slots,
+                # so the thread is still owned and cleaned up when it ends
+                self.keep_loader_until_finished(thread)
+                self._loader_handed_over = True
+        self.disconnect_loading_thread()
+        super().done(result)
+    
+    @staticmethod
+    def keep_loader_until_finished(thread: ChannelVideosLoaderThread):
+        """Keep a loader thread alive past its dialog, then delete it once finished."""
+        key = id(thread)
+        _stopping_loaders[key] = thread
+        # deleteLater and destroyed both run in the GUI thread, after the thread ended
+        thread.destroyed.connect(lambda: _stopping_loaders.pop(key, None))
+        thread.finished.connect(thread.deleteLater)
+        # It may have finished before the connections were made
+        if thread.isFinished():
+            thread.deleteLater()
+    
+    def disconnect_loading_thread(self):
+        """
+        Disconnect the loader thread's signals from this dialog.
+        
+        Only the loader's own signals are disconnected; the QThread.finished ->
+        deleteLater connection of keep_loader_until_finished is kept.
+        """
+        thread = self.loading_thread
+        for signal in (thread.progress_signal, thread.progress_percent_signal,
+                       thread.video_updated_signal, thread.finished_signal):
+            try:
+                signal.disconnect()
+            except (RuntimeError, TypeError):
+                pass  # already disconnected
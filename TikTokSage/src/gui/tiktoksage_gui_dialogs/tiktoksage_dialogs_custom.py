@@ -9,7 +9,12 @@ from .tiktoksage_dialogs_base import BaseTikTokDialog
 
 
 class CustomOptionsDialog(BaseTikTokDialog):
-    """Dialog for custom options."""
+    """
+    Dialog for custom options.
+    
+    The dialog keeps no per-invocation state, so a caller can create it once and
+    exec() the same instance on every open instead of rebuilding its widgets.
+    """
     
     def __init__(self, parent=None):
         super().__init__(parent, "Custom Options")
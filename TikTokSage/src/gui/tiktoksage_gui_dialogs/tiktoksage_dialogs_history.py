@@ -4,376 +4,505 @@ History Dialog
 Dialog for viewing download history with modern card-based UI.
 """
 
+import hashlib
+import os
+import threading
 from io import BytesIO
 from pathlib import Path
 from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 
+import requests
 from PIL import Image
-from PySide6.QtCore import Qt, QTimer, QThread, Signal
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import (
+    Qt,
+    QTimer,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    Signal,
+    QAbstractListModel,
+    QBuffer,
+    QByteArray,
+    QIODevice,
+    QModelIndex,
+    QPoint,
+    QRect,
+    QSize,
+)
+from PySide6.QtGui import (
+    QColor,
+    QFont,
+    QFontMetrics,
+    QImage,
+    QImageReader,
+    QPainter,
+    QPen,
+    QPixmap,
+    QPixmapCache,
+)
+from requests.adapters import HTTPAdapter
 from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QApplication,
     QVBoxLayout,
     QLabel,
+    QListView,
     QPushButton,
     QHBoxLayout,
-    QScrollArea,
-    QWidget,
-    QFrame,
     QMessageBox,
     QMenu,
     QLineEdit,
+    QStyle,
+    QStyledItemDelegate,
 )
 
 from .tiktoksage_dialogs_base import BaseTikTokDialog
+from src.utils.tiktoksage_constants import APP_THUMBNAILS_DIR
 from src.utils.tiktoksage_history_manager import HistoryManager
 from src.utils.tiktoksage_logger import logger
 
+# QPixmapCache budget in KB, enough for ~200 decoded thumbnails
+THUMBNAIL_CACHE_LIMIT_KB = 51200
+
+# Timeout in seconds for a thumbnail request; the placeholder stays on failure
+THUMBNAIL_TIMEOUT = 3
+
+# Chunk size in bytes used when streaming a thumbnail response
+THUMBNAIL_CHUNK_SIZE = 64 * 1024
+
+# Concurrent thumbnail fetches per history dialog
+THUMBNAIL_WORKERS = 8
+
+# Bounds of a displayed thumbnail; pixmaps are scaled to fit them once, on load
+THUMBNAIL_MAX_SIZE = QSize(320, 240)
+THUMBNAIL_MIN_SIZE = QSize(80, 60)
+
+# Card geometry used by HistoryCardDelegate (pixels)
+CARD_HEIGHT = 280
+CARD_MARGIN = 4
+CARD_PADDING = 12
+CARD_SPACING = 15
+# Title lines shown before the title is clipped
+CARD_TITLE_LINES = 3
+
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_DECORATION_ROLE = Qt.ItemDataRole.DecorationRole
+_TOOLTIP_ROLE = Qt.ItemDataRole.ToolTipRole
+# The raw history entry dict
+_ENTRY_ROLE = Qt.ItemDataRole.UserRole
+# The card text tuple built by _card_fields
+_CARD_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+def _create_thumbnail_session() -> requests.Session:
+    """Create the pooled session used for thumbnail requests."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=1)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# One session for all thumbnails so connections to the CDN (and their TLS
+# sessions) are reused instead of handshaking once per history entry
+_THUMB_HTTP = _create_thumbnail_session()
+
+
+def _thumb_path(url: str) -> Path:
+    """Get the on-disk cache file for a thumbnail URL."""
+    digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return APP_THUMBNAILS_DIR / f"{digest}.jpg"
+
+
+def _save_thumbnail(path: Path, data: bytes) -> None:
+    """Atomically write downloaded thumbnail bytes to the disk cache."""
+    # Per-thread temp name so duplicate entries fetching the same URL don't clash
+    tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.debug(f"Could not write thumbnail cache {path}: {e}")
+
+
+def _decode_thumbnail(source) -> QImage:
+    """
+    Decode a thumbnail, letting the decoder downscale it to display size.
+    
+    For JPEGs, setScaledSize makes libjpeg scale during the DCT, so a 720x1280
+    cover is never decoded at full resolution.
+    
+    Args:
+        source: Image file name or an open QIODevice
+    """
+    reader = QImageReader(source)
+    reader.setDecideFormatFromContent(True)
+    size = reader.size()
+    if size.isValid() and (size.width() > THUMBNAIL_MAX_SIZE.width()
+                           or size.height() > THUMBNAIL_MAX_SIZE.height()):
+        reader.setScaledSize(size.scaled(THUMBNAIL_MAX_SIZE, Qt.AspectRatioMode.KeepAspectRatio))
+    image = reader.read()
+    
+    if image.isNull() and reader.scaledSize().isValid():
+        # Fall back to a full decode for formats that can't decode scaled
+        if isinstance(source, QIODevice):
+            source.seek(0)
+        image = QImageReader(source).read()
+    return image
+
+
+def _scale_thumbnail(pixmap: QPixmap) -> QPixmap:
+    """
+    Scale a thumbnail to its display size, keeping the original aspect ratio.
+    
+    Thumbnails decoded by _decode_thumbnail usually already have this size.
+    """
+    scaled_size = pixmap.size().scaled(THUMBNAIL_MAX_SIZE, Qt.AspectRatioMode.KeepAspectRatio)
+    
+    # Ensure minimum size
+    if (scaled_size.width() < THUMBNAIL_MIN_SIZE.width()
+            or scaled_size.height() < THUMBNAIL_MIN_SIZE.height()):
+        scaled_size = pixmap.size().scaled(
+            THUMBNAIL_MIN_SIZE, Qt.AspectRatioMode.KeepAspectRatioByExpanding
+        )
+    
+    return pixmap.scaled(
+        scaled_size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
+    )
+
+
+class ThumbFetchSignals(QObject):
+    """Signals emitted by ThumbFetcher tasks (QRunnable can't declare signals)."""
+    # Emitted with a null image when the thumbnail could not be loaded
+    loaded = Signal(str, QImage)
+
+
+class ThumbFetcher(QRunnable):
+    """Pool task that loads one thumbnail from the disk cache or the network."""
+    
+    def __init__(self, url: str, signals: ThumbFetchSignals):
+        super().__init__()
+        self.url = url
+        # Holding the bridge keeps it alive while the task is queued or running
+        self.signals = signals
+    
+    def run(self):
+        # Decode to QImage here; QPixmap may only be created in the GUI thread
+        image = QImage()
+        try:
+            # Thumbnail URLs are stable per video, so try the disk cache first
+            path = _thumb_path(self.url)
+            if path.exists():
+                image = _decode_thumbnail(str(path))
+            if image.isNull():
+                data = self._download()
+                if data is not None:
+                    buffer = QBuffer(data)
+                    buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+                    image = _decode_thumbnail(buffer)
+                    if not image.isNull():
+                        _save_thumbnail(path, data.data())
+        except Exception:
+            image = QImage()  # Keep placeholder if failed
+        self.signals.loaded.emit(self.url, image)
+    
+    def _download(self) -> Optional[QByteArray]:
+        """Stream the thumbnail straight into a QByteArray for QImageReader."""
+        with _THUMB_HTTP.get(self.url, stream=True, timeout=THUMBNAIL_TIMEOUT) as response:
+            if response.status_code != 200:
+                return None
+            data = QByteArray()
+            for chunk in response.iter_content(THUMBNAIL_CHUNK_SIZE):
+                data.append(chunk)
+            return data
+
+
+def _format_file_size(size_bytes):
+    """Format file size in human readable format."""
+    if size_bytes == 0:
+        return "0 B"
+    
+    size_names = ["B", "KB", "MB", "GB"]
+    i = 0
+    size = float(size_bytes)
+    
+    while size >= 1024.0 and i < len(size_names) - 1:
+        size /= 1024.0
+        i += 1
+    
+    if i == 0:
+        return f"{int(size)} {size_names[i]}"
+    else:
+        return f"{size:.1f} {size_names[i]}"
+
 
-class HistoryEntryWidget(QFrame):
-    """Widget representing a single history entry with thumbnail and details."""
+def _card_fields(entry: dict) -> Tuple[str, str, str, str, str]:
+    """
+    Build the text shown on a history card.
+    
+    Returns:
+        Tuple of (title, author, date, type, size) display strings
+    """
+    title = entry.get("title", "Unknown Title")
+    
+    # Channel/Author
+    url = entry.get("url", "")
+    author = "Unknown"
+    if "@" in url:
+        try:
+            author = url.split("@")[1].split("/")[0]
+            author = f"Channel: {author}"
+        except:
+            author = "Channel: Unknown"
+    
+    # Date and time
+    timestamp = entry.get("timestamp", "")
+    if timestamp:
+        try:
+            if isinstance(timestamp, str):
+                date_text = f"Downloaded: {timestamp}"
+            else:
+                date_text = f"Downloaded: {str(timestamp)}"
+        except:
+            date_text = "Downloaded: Unknown"
+    else:
+        date_text = "Downloaded: Unknown"
     
-    def __init__(self, entry: dict, parent=None):
+    # Type
+    type_text = "Audio" if entry.get("is_audio_only", False) else "Video"
+    
+    # Size (calculate from file path or metadata)
+    size_text = "Size: N/A"
+    file_path = entry.get("file_path", "")
+    
+    # Try to get file size from actual file
+    if file_path and Path(file_path).exists():
+        try:
+            size_bytes = Path(file_path).stat().st_size
+            size_text = f"Size: {_format_file_size(size_bytes)}"
+        except Exception:
+            pass
+    
+    # Try to get from metadata
+    elif "raw_data" in entry and hasattr(entry["raw_data"], 'video'):
+        try:
+            # Estimate size from video metadata (rough estimate)
+            duration = getattr(entry["raw_data"].video, 'duration', 0)
+            if duration > 0:
+                # Rough estimate: 1MB per 10 seconds for TikTok videos
+                estimated_size = duration * 1024 * 1024 / 10
+                size_text = f"Size: ~{_format_file_size(estimated_size)}"
+        except Exception:
+            pass
+    
+    return title, author, date_text, type_text, size_text
+
+
+class HistoryModel(QAbstractListModel):
+    """
+    List model of the download history shown in the dialog.
+    
+    Card text is built on first use (it stats the downloaded file) and kept per
+    row. Thumbnails live in QPixmapCache; a row whose thumbnail isn't cached
+    emits thumbnail_needed the first time it is painted, so only rows that are
+    actually scrolled into view are fetched.
+    """
+    
+    thumbnail_needed = Signal(str)  # Thumbnail URL to fetch
+    
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.entry = entry
-        self.entry_id = entry.get("id", "")
-        
-        self.setup_ui()
+        self._entries: List[dict] = []
+        self._cards: List[Optional[Tuple[str, str, str, str, str]]] = []
+        self._rows_by_thumb: Dict[str, List[int]] = {}  # Thumbnail URL -> rows using it
+        self._thumb_pending = set()  # URLs requested and not answered yet
+        self._thumb_failed = set()  # URLs that could not be loaded (placeholder)
     
-    def setup_ui(self):
-        """Setup the UI for this history entry."""
-        self.setFrameStyle(QFrame.Shape.StyledPanel | QFrame.Shadow.Raised)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #2a2a2a;
-                border: 1px solid #404040;
-                border-radius: 8px;
-                padding: 12px;
-                margin: 4px;
-            }
-            QFrame:hover {
-                background-color: #333333;
-                border-color: #505050;
-            }
-        """)
-        
-        main_layout = QVBoxLayout(self)  # Vertical layout for large thumbnail
-        main_layout.setSpacing(15)
-        main_layout.setContentsMargins(12, 12, 12, 12)
-        
-        # Thumbnail
-        self.thumbnail_label = QLabel()
-        self.thumbnail_label.setMaximumSize(400, 300)  # Max size but not fixed
-        self.thumbnail_label.setMinimumSize(80, 60)   # Min size
-        self.thumbnail_label.setStyleSheet("""
-            QLabel {
-                border: 1px solid #404040;
-                border-radius: 4px;
-                background-color: #1a1a1a;
-            }
-        """)
-        self.thumbnail_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.thumbnail_label.setScaledContents(True)
-        
-        self.load_thumbnail()
-        main_layout.addWidget(self.thumbnail_label, alignment=Qt.AlignmentFlag.AlignCenter)
-        
-        # Info section
-        info_layout = QVBoxLayout()
-        info_layout.setSpacing(3)
-        
-        # Title
-        title = self.entry.get("title", "Unknown Title")
-        self.title_label = QLabel(title)
-        self.title_label.setWordWrap(True)
-        self.title_label.setStyleSheet("""
-            QLabel {
-                font-size: 14px;
-                font-weight: bold;
-                color: #ffffff;
-            }
-        """)
-        info_layout.addWidget(self.title_label)
-        
-        # Channel/Author
-        url = self.entry.get("url", "")
-        author = "Unknown"
-        if "@" in url:
-            try:
-                author = url.split("@")[1].split("/")[0]
-                author = f"Channel: {author}"
-            except:
-                author = "Channel: Unknown"
-        author_label = QLabel(author)
-        author_label.setStyleSheet("color: #cccccc; font-size: 12px;")
-        info_layout.addWidget(author_label)
-        
-        # Date and time
-        timestamp = self.entry.get("timestamp", "")
-        if timestamp:
-            try:
-                # Parse timestamp and format
-                if isinstance(timestamp, str):
-                    date_label = QLabel(f"Downloaded: {timestamp}")
-                else:
-                    date_label = QLabel(f"Downloaded: {str(timestamp)}")
-            except:
-                date_label = QLabel("Downloaded: Unknown")
-        else:
-            date_label = QLabel("Downloaded: Unknown")
-        date_label.setStyleSheet("color: #999999; font-size: 11px;")
-        info_layout.addWidget(date_label)
-        
-        # Type and size
-        details_layout = QHBoxLayout()
-        details_layout.setSpacing(10)
-        
-        # Type
-        is_audio = self.entry.get("is_audio_only", False)
-        type_label = QLabel("Audio" if is_audio else "Video")
-        type_label.setStyleSheet("""
-            QLabel {
-                background-color: #007acc;
-                color: white;
-                padding: 2px 8px;
-                border-radius: 3px;
-                font-size: 10px;
-                font-weight: bold;
-            }
-        """)
-        details_layout.addWidget(type_label)
-        
-        # Size (calculate from file path or metadata)
-        size_text = "Size: N/A"
-        file_path = self.entry.get("file_path", "")
-        
-        # Try to get file size from actual file
-        if file_path and Path(file_path).exists():
-            try:
-                size_bytes = Path(file_path).stat().st_size
-                size_text = f"Size: {self._format_file_size(size_bytes)}"
-            except Exception:
-                pass
-        
-        # Try to get from metadata
-        elif "raw_data" in self.entry and hasattr(self.entry["raw_data"], 'video'):
-            try:
-                # Estimate size from video metadata (rough estimate)
-                duration = getattr(self.entry["raw_data"].video, 'duration', 0)
-                if duration > 0:
-                    # Rough estimate: 1MB per 10 seconds for TikTok videos
-                    estimated_size = duration * 1024 * 1024 / 10
-                    size_text = f"Size: ~{self._format_file_size(estimated_size)}"
-            except Exception:
-                pass
-        
-        size_label = QLabel(size_text)
-        size_label.setStyleSheet("color: #888888; font-size: 11px;")
-        details_layout.addWidget(size_label)
-        
-        details_layout.addStretch()
-        info_layout.addLayout(details_layout)
-        
-        # Menu button hidden
-        # self.menu_button = QPushButton("⚙")
-        # self.menu_button.setFixedSize(32, 32)
-        # self.menu_button.setText("⚙")  # Use gear icon - more visible
-        # self.menu_button.setToolTip("Menu Options")  # Add tooltip
-        # self.menu_button.setStyleSheet("""
-        #     QPushButton {
-        #         background-color: #404040;
-        #         border: 1px solid #555555;
-        #         border-radius: 16px;
-        #         color: white;
-        #         font-size: 18px;
-        #         font-weight: bold;
-        #         font-family: "Segoe UI Symbol", "Apple Color Emoji", Arial, sans-serif;
-        #         text-align: center;
-        #         line-height: 32px;
-        #     }
-        #     QPushButton:hover {
-        #         background-color: #4a9eff;
-        #         border-color: #6bb6ff;
-        #         transform: scale(1.05);
-        #     }
-        #     QPushButton:pressed {
-        #         background-color: #ff4444;
-        #         border-color: #ff6666;
-        #     }
-        # """)
-        # self.menu_button.clicked.connect(self.show_menu)
-        # details_with_menu_layout.addWidget(self.menu_button, alignment=Qt.AlignmentFlag.AlignTop)
-        
-        info_layout.addLayout(details_layout)
-        main_layout.addLayout(info_layout)
-    
-    def load_thumbnail(self):
-        """Load and display the thumbnail with caching and timeout."""
-        thumbnail_url = self.entry.get("thumbnail_url")
-        
-        if not thumbnail_url:
-            self.set_placeholder_thumbnail()
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+    
+    def data(self, index, role=_DISPLAY_ROLE):
+        if not index.isValid():
+            return None
+        row = index.row()
+        entry = self._entries[row]
+        if role == _CARD_ROLE:
+            card = self._cards[row]
+            if card is None:
+                card = self._cards[row] = _card_fields(entry)
+            return card
+        if role == _DECORATION_ROLE:
+            return self._thumbnail(entry.get("thumbnail_url"))
+        if role == _DISPLAY_ROLE:
+            return entry.get("title", "Unknown Title")
+        if role == _TOOLTIP_ROLE:
+            return entry.get("url", "")
+        if role == _ENTRY_ROLE:
+            return entry
+        return None
+    
+    def _thumbnail(self, url: Optional[str]) -> Optional[QPixmap]:
+        """Return the cached thumbnail for a URL, requesting it on a miss."""
+        if not url:
+            return None
+        pixmap = QPixmapCache.find(url)
+        if pixmap is not None and not pixmap.isNull():
+            return pixmap
+        # Evicted thumbnails are requested again and come back from the disk cache
+        if url not in self._thumb_pending and url not in self._thumb_failed:
+            self._thumb_pending.add(url)
+            self.thumbnail_needed.emit(url)
+        return None
+    
+    def entry(self, row: int) -> dict:
+        """Return the history entry shown in a row."""
+        return self._entries[row]
+    
+    def set_entries(self, entries: List[dict]):
+        """Replace all rows (a single reset notification)."""
+        self.beginResetModel()
+        self._entries = list(entries)
+        self._cards = [None] * len(self._entries)
+        self._thumb_pending.clear()
+        self._thumb_failed.clear()
+        self._index_thumbnails()
+        self.endResetModel()
+    
+    def remove_row(self, row: int):
+        """Remove a single row."""
+        if not 0 <= row < len(self._entries):
             return
-        
-        # Set placeholder first
-        self.set_placeholder_thumbnail()
-        
-        # Load thumbnail in background to avoid blocking UI
-        from PySide6.QtCore import QThread, Signal
-        
-        class ThumbnailLoader(QThread):
-            loaded = Signal(QPixmap)
-            
-            def __init__(self, url):
-                super().__init__()
-                self.url = url
-            
-            def run(self):
-                try:
-                    import requests
-                    response = requests.get(self.url, timeout=3)  # Short timeout
-                    if response.status_code == 200:
-                        pixmap = QPixmap()
-                        if pixmap.loadFromData(response.content) and not pixmap.isNull():
-                            self.loaded.emit(pixmap)
-                except Exception:
-                    pass  # Keep placeholder if failed
-        
-        # Start background loading
-        self.thumbnail_loader = ThumbnailLoader(thumbnail_url)
-        self.thumbnail_loader.loaded.connect(self._on_thumbnail_loaded)
-        self.thumbnail_loader.start()
-    
-    def _on_thumbnail_loaded(self, pixmap):
-        """Handle thumbnail loaded in background with original aspect ratio."""
-        if hasattr(self, 'thumbnail_label') and self.thumbnail_label:
-            # Calculate scaled size maintaining aspect ratio
-            original_size = pixmap.size()
-            max_size = self.thumbnail_label.maximumSize()
-            min_size = self.thumbnail_label.minimumSize()
-            
-            # Scale to fit within max size while maintaining aspect ratio
-            scaled_size = original_size.scaled(max_size, Qt.AspectRatioMode.KeepAspectRatio)
-            
-            # Ensure minimum size
-            if scaled_size.width() < min_size.width() or scaled_size.height() < min_size.height():
-                scaled_size = original_size.scaled(min_size, Qt.AspectRatioMode.KeepAspectRatioByExpanding)
-            
-            # Set the scaled pixmap
-            scaled_pixmap = pixmap.scaled(scaled_size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            self.thumbnail_label.setPixmap(scaled_pixmap)
-            self.thumbnail_label.setFixedSize(scaled_size)
-    
-    def _format_file_size(self, size_bytes):
-        """Format file size in human readable format."""
-        if size_bytes == 0:
-            return "0 B"
-        
-        size_names = ["B", "KB", "MB", "GB"]
-        i = 0
-        size = float(size_bytes)
-        
-        while size >= 1024.0 and i < len(size_names) - 1:
-            size /= 1024.0
-            i += 1
-        
-        if i == 0:
-            return f"{int(size)} {size_names[i]}"
-        else:
-            return f"{size:.1f} {size_names[i]}"
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._entries[row]
+        del self._cards[row]
+        self._index_thumbnails()
+        self.endRemoveRows()
     
-    def set_placeholder_thumbnail(self):
-        """Set a placeholder when thumbnail is not available."""
-        self.thumbnail_label.setText("🎵")
-        self.thumbnail_label.setStyleSheet("""
-            QLabel {
-                border: 1px solid #404040;
-                border-radius: 4px;
-                background-color: #1a1a1a;
-                font-size: 72px;
-            }
-        """)
+    def set_thumbnail(self, url: str, pixmap: Optional[QPixmap]):
+        """Store a fetched (already scaled) thumbnail and repaint its rows."""
+        self._thumb_pending.discard(url)
+        if pixmap is None:
+            self._thumb_failed.add(url)
+            return
+        QPixmapCache.insert(url, pixmap)
+        for row in self._rows_by_thumb.get(url, ()):
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [_DECORATION_ROLE])
     
-    def show_menu(self):
-        """Show context menu for this entry with improved styling."""
-        menu = QMenu(self)
-        menu.setStyleSheet("""
-            QMenu {
-                background-color: #2a2a2a;
-                border: 1px solid #404040;
-                border-radius: 8px;
-                padding: 4px;
-                min-width: 180px;
-            }
-            QMenu::item {
-                background-color: transparent;
-                color: #ffffff;
-                padding: 8px 16px;
-                border-radius: 4px;
-                margin: 2px;
-            }
-            QMenu::item:selected {
-                background-color: #4a9eff;
-                color: white;
-            }
-            QMenu::separator {
-                height: 1px;
-                background-color: #404040;
-                margin: 4px 8px;
-            }
-        """)
-        
-        # Delete from History with icon
-        delete_action = menu.addAction("🗑️ Delete from History")
-        delete_action.triggered.connect(self.delete_entry)
-        
-        # Add separator
-        menu.addSeparator()
-        
-        # Redownload with icon
-        redownload_action = menu.addAction("⬇️ Redownload")
-        redownload_action.triggered.connect(self.redownload_entry)
-        
-        # Copy URL with icon
-        copy_url_action = menu.addAction("📋 Copy URL")
-        copy_url_action.triggered.connect(self.copy_url)
-        
-        # Position menu to show on the right side of the button
-        button_rect = self.menu_button.rect()
-        global_pos = self.menu_button.mapToGlobal(button_rect.topRight())
-        menu.exec(global_pos)
-    
-    def copy_url(self):
-        """Copy URL to clipboard."""
-        from PySide6.QtWidgets import QApplication
-        clipboard = QApplication.clipboard()
-        url = self.entry.get("url", "")
-        if url:
-            clipboard.setText(url)
-            # Show brief feedback
-            self.menu_button.setText("✓")
-            QTimer.singleShot(1000, lambda: self.menu_button.setText("⋮"))
+    def _index_thumbnails(self):
+        """Rebuild the thumbnail URL -> rows map (entries may share a thumbnail)."""
+        rows_by_thumb = {}
+        for row, entry in enumerate(self._entries):
+            url = entry.get("thumbnail_url")
+            if url:
+                rows_by_thumb.setdefault(url, []).append(row)
+        self._rows_by_thumb = rows_by_thumb
+
+
+class HistoryCardDelegate(QStyledItemDelegate):
+    """Paints a history entry as a card: thumbnail on the left, details on the right."""
     
-    def delete_entry(self):
-        """Delete this history entry."""
-        try:
-            HistoryManager.remove_entry(self.entry_id)
-            self.setVisible(False)
-            self.deleteLater()
-            # Update parent's count if available
-            if hasattr(self.parent(), 'update_count'):
-                self.parent().update_count()
-            logger.info(f"Deleted history entry: {self.entry_id}")
-        except Exception as e:
-            logger.error(f"Error deleting entry: {e}")
-            QMessageBox.warning(self, "Error", f"Failed to delete entry: {e}")
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._title_font = QFont()
+        self._title_font.setPixelSize(14)
+        self._title_font.setBold(True)
+        self._author_font = QFont()
+        self._author_font.setPixelSize(12)
+        self._detail_font = QFont()
+        self._detail_font.setPixelSize(11)
+        self._badge_font = QFont()
+        self._badge_font.setPixelSize(10)
+        self._badge_font.setBold(True)
+        self._placeholder_font = QFont()
+        self._placeholder_font.setPixelSize(48)
     
-    def redownload_entry(self):
-        """Redownload this entry."""
-        QMessageBox.information(
-            self,
-            "Redownload",
-            "Redownload feature coming soon!\n\nURL: " + self.entry.get("url", "N/A")
-        )
+    def sizeHint(self, option, index):
+        inset = 2 * (CARD_MARGIN + CARD_PADDING)
+        return QSize(THUMBNAIL_MAX_SIZE.width() + inset + CARD_SPACING, CARD_HEIGHT)
+    
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Card background
+        card = option.rect.adjusted(CARD_MARGIN, CARD_MARGIN, -CARD_MARGIN, -CARD_MARGIN)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        if selected:
+            border = "#4a9eff"
+        elif hovered:
+            border = "#505050"
+        else:
+            border = "#404040"
+        painter.setPen(QPen(QColor(border)))
+        painter.setBrush(QColor("#333333" if hovered else "#2a2a2a"))
+        painter.drawRoundedRect(card, 8, 8)
+        content = card.adjusted(CARD_PADDING, CARD_PADDING, -CARD_PADDING, -CARD_PADDING)
+        
+        # Thumbnail box, vertically centered on the left
+        thumb_rect = QRect(QPoint(0, 0), THUMBNAIL_MAX_SIZE)
+        thumb_rect.moveCenter(QPoint(content.left() + THUMBNAIL_MAX_SIZE.width() // 2, content.center().y()))
+        painter.setPen(QPen(QColor("#404040")))
+        painter.setBrush(QColor("#1a1a1a"))
+        painter.drawRoundedRect(thumb_rect, 4, 4)
+        
+        pixmap = index.data(_DECORATION_ROLE)
+        if pixmap is not None:
+            # Pixmaps are pre-scaled to fit the box, so this is a plain blit
+            target = QRect(QPoint(0, 0), pixmap.size())
+            target.moveCenter(thumb_rect.center())
+            painter.drawPixmap(target.topLeft(), pixmap)
+        else:
+            painter.setFont(self._placeholder_font)
+            painter.setPen(QColor("#ffffff"))
+            painter.drawText(thumb_rect, Qt.AlignmentFlag.AlignCenter, "🎵")
+        
+        # Info section
+        title, author, date_text, type_text, size_text = index.data(_CARD_ROLE)
+        text_rect = content.adjusted(THUMBNAIL_MAX_SIZE.width() + CARD_SPACING, 0, 0, 0)
+        width = text_rect.width()
+        y = text_rect.top()
+        
+        # Title, wrapped and clipped to CARD_TITLE_LINES lines
+        painter.setFont(self._title_font)
+        painter.setPen(QColor("#ffffff"))
+        metrics = QFontMetrics(self._title_font)
+        flags = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap
+        max_height = metrics.lineSpacing() * CARD_TITLE_LINES
+        title_height = min(metrics.boundingRect(QRect(0, 0, width, max_height), flags, title).height(), max_height)
+        painter.drawText(QRect(text_rect.left(), y, width, title_height), flags, title)
+        y += title_height + 3
+        
+        # Channel/Author and date
+        for text, font, color in ((author, self._author_font, "#cccccc"),
+                                  (date_text, self._detail_font, "#999999")):
+            painter.setFont(font)
+            painter.setPen(QColor(color))
+            metrics = QFontMetrics(font)
+            line = metrics.elidedText(text, Qt.TextElideMode.ElideRight, width)
+            painter.drawText(QRect(text_rect.left(), y, width, metrics.height()), Qt.AlignmentFlag.AlignLeft, line)
+            y += metrics.height() + 3
+        
+        # Type badge and size
+        metrics = QFontMetrics(self._badge_font)
+        badge = QRect(text_rect.left(), y, metrics.horizontalAdvance(type_text) + 16, metrics.height() + 4)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor("#007acc"))
+        painter.drawRoundedRect(badge, 3, 3)
+        painter.setFont(self._badge_font)
+        painter.setPen(QColor("#ffffff"))
+        painter.drawText(badge, Qt.AlignmentFlag.AlignCenter, type_text)
+        
+        painter.setFont(self._detail_font)
+        painter.setPen(QColor("#888888"))
+        size_rect = QRect(badge.right() + 10, y, max(width - badge.width() - 10, 0), badge.height())
+        painter.drawText(size_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, size_text)
+        
+        painter.restore()
 
 
 class HistoryDialog(BaseTikTokDialog):
@@ -382,6 +511,14 @@ class HistoryDialog(BaseTikTokDialog):
     def __init__(self, parent=None):
         super().__init__(parent, "Download History")
         self.setMinimumSize(1000, 700)  # Larger window for big thumbnails
+        QPixmapCache.setCacheLimit(THUMBNAIL_CACHE_LIMIT_KB)
+        
+        # Thumbnails are fetched by a bounded pool instead of one thread per entry
+        self.thumb_pool = QThreadPool()
+        self.thumb_pool.setMaxThreadCount(THUMBNAIL_WORKERS)
+        self.thumb_signals = ThumbFetchSignals()
+        self.thumb_signals.loaded.connect(self._on_thumbnail_fetched)
+        
         self.init_ui()
     
     def init_ui(self):
@@ -444,11 +581,20 @@ class HistoryDialog(BaseTikTokDialog):
         self.search_input.textChanged.connect(self.filter_history)
         layout.addWidget(self.search_input)
         
-        # Scroll area for history entries
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
+        # History entries: the view only paints the visible cards
+        self.history_model = HistoryModel(self)
+        self.history_model.thumbnail_needed.connect(self.request_thumbnail)
+        self.history_view = QListView()
+        self.history_view.setModel(self.history_model)
+        self.history_view.setItemDelegate(HistoryCardDelegate(self.history_view))
+        self.history_view.setUniformItemSizes(True)
+        self.history_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.history_view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.history_view.setMouseTracking(True)  # Hover highlight on cards
+        self.history_view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.history_view.customContextMenuRequested.connect(self.show_menu)
+        self.history_view.setStyleSheet("""
+            QListView {
                 background-color: #1a1a1a;
                 border: none;
             }
@@ -464,19 +610,19 @@ class HistoryDialog(BaseTikTokDialog):
                 background-color: #505050;
             }
         """)
+        layout.addWidget(self.history_view)
         
-        # Container widget for history entries
-        self.container = QWidget()
-        self.container_layout = QVBoxLayout(self.container)
-        self.container_layout.setSpacing(10)
-        self.container_layout.setContentsMargins(5, 5, 5, 5)
-        
-        # Initialize history entries list
-        self.history_entries = []
-        
-        self.container_layout.addStretch()
-        scroll_area.setWidget(self.container)
-        layout.addWidget(scroll_area)
+        self.no_history_label = QLabel("No download history yet")
+        self.no_history_label.setStyleSheet("""
+            QLabel {
+                color: #666666;
+                font-size: 14px;
+                padding: 40px;
+            }
+        """)
+        self.no_history_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.no_history_label.hide()
+        layout.addWidget(self.no_history_label)
         
         # Footer with download count
         footer_layout = QHBoxLayout()
@@ -515,84 +661,136 @@ class HistoryDialog(BaseTikTokDialog):
         # Load and display history entries after all UI elements are created
         self.load_history()
     
+    def request_thumbnail(self, url: str):
+        """Queue a thumbnail fetch (the model requests each URL once)."""
+        self.thumb_pool.start(ThumbFetcher(url, self.thumb_signals))
+    
+    def _on_thumbnail_fetched(self, url: str, image: QImage):
+        """Hand a fetched thumbnail to the model."""
+        if image.isNull():
+            self.history_model.set_thumbnail(url, None)
+            return
+        # Scale once per URL; the model caches the scaled pixmap, so reopening skips both
+        self.history_model.set_thumbnail(url, _scale_thumbnail(QPixmap.fromImage(image)))
+    
+    def cancel_thumbnails(self):
+        """Drop queued thumbnail fetches; running ones finish and are ignored."""
+        self.thumb_pool.clear()
+    
+    def done(self, result):
+        """Stop fetching thumbnails when the dialog closes."""
+        self.cancel_thumbnails()
+        super().done(result)
+    
     def load_history(self):
-        """Load and display history entries with lazy loading."""
-        # Clear existing widgets
-        for i in reversed(range(self.container_layout.count())):
-            child = self.container_layout.itemAt(i).widget()
-            if child:
-                child.deleteLater()
-        
-        # Load history entries
-        self.history_entries = []
-        history = HistoryManager.get_all_entries()
+        """Load and display history entries."""
+        self.cancel_thumbnails()
         
-        if history:
-            # Load first 10 entries immediately, rest with delay
-            initial_batch = history[:10]
-            remaining_batch = history[10:]
-            
-            for entry in initial_batch:
-                entry_widget = HistoryEntryWidget(entry, self)
-                self.history_entries.append(entry_widget)
-                self.container_layout.addWidget(entry_widget)
-            
-            # Load remaining entries with delay to prevent UI freezing
-            if remaining_batch:
-                self.load_remaining_entries(remaining_batch)
-        else:
-            no_history_label = QLabel("No download history yet")
-            no_history_label.setStyleSheet("""
-                QLabel {
-                    color: #666666;
-                    font-size: 14px;
-                    padding: 40px;
-                }
-            """)
-            no_history_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.container_layout.addWidget(no_history_label)
+        # A model reset is cheap: no per-entry widgets are built
+        history = HistoryManager.get_all_entries()
+        self.history_model.set_entries(history)
+        self.history_view.setVisible(bool(history))
+        self.no_history_label.setVisible(not history)
         
         # Update count
         self.update_count()
-    
-    def load_remaining_entries(self, entries):
-        """Load remaining history entries with delay."""
-        def load_next():
-            if not entries:
-                return
-            
-            entry = entries.pop(0)
-            entry_widget = HistoryEntryWidget(entry, self)
-            self.history_entries.append(entry_widget)
-            self.container_layout.addWidget(entry_widget)
-            
-            # Update count
-            self.update_count()
-            
-            # Load next entry after short delay
-            if entries:
-                QTimer.singleShot(50, load_next)  # 50ms delay between each
-        
-        QTimer.singleShot(100, load_next)  # Start after 100ms
+        # Reapply an active search (the reset clears hidden rows)
+        self.filter_history(self.search_input.text())
     
     def update_count(self):
         """Update the download count label."""
-        count = len(self.history_entries) if hasattr(self, 'history_entries') else 0
-        self.count_label.setText(f"{count} downloads")
+        self.count_label.setText(f"{self.history_model.rowCount()} downloads")
     
     def filter_history(self, text):
         """Filter history entries based on search text."""
         search_text = text.lower()
         
-        for entry_widget in self.history_entries:
-            title = entry_widget.entry.get("title", "").lower()
-            url = entry_widget.entry.get("url", "").lower()
-            
-            if search_text in title or search_text in url:
-                entry_widget.setVisible(True)
-            else:
-                entry_widget.setVisible(False)
+        for row in range(self.history_model.rowCount()):
+            entry = self.history_model.entry(row)
+            title = entry.get("title", "").lower()
+            url = entry.get("url", "").lower()
+            self.history_view.setRowHidden(row, not (search_text in title or search_text in url))
     
+    def show_menu(self, pos):
+        """Show context menu for the entry under the cursor."""
+        index = self.history_view.indexAt(pos)
+        if not index.isValid():
+            return
+        row = index.row()
+        
+        menu = QMenu(self)
+        menu.setStyleSheet("""
+            QMenu {
+                background-color: #2a2a2a;
+                border: 1px solid #404040;
+                border-radius: 8px;
+                padding: 4px;
+                min-width: 180px;
+            }
+            QMenu::item {
+                background-color: transparent;
+                color: #ffffff;
+                padding: 8px 16px;
+                border-radius: 4px;
+                margin: 2px;
+            }
+            QMenu::item:selected {
+                background-color: #4a9eff;
+                color: white;
+            }
+            QMenu::separator {
+                height: 1px;
+                background-color: #404040;
+                margin: 4px 8px;
+            }
+        """)
+        
+        # Delete from History with icon
+        delete_action = menu.addAction("🗑️ Delete from History")
+        delete_action.triggered.connect(lambda: self.delete_entry(row))
+        
+        # Add separator
+        menu.addSeparator()
+        
+        # Redownload with icon
+        redownload_action = menu.addAction("⬇️ Redownload")
+        redownload_action.triggered.connect(lambda: self.redownload_entry(row))
+        
+        # Copy URL with icon
+        copy_url_action = menu.addAction("📋 Copy URL")
+        copy_url_action.triggered.connect(lambda: self.copy_url(row))
+        
+        menu.exec(self.history_view.viewport().mapToGlobal(pos))
+    
+    def copy_url(self, row: int):
+        """Copy an entry's URL to clipboard."""
+        url = self.history_model.entry(row).get("url", "")
+        if url:
+            QApplication.clipboard().setText(url)
+            # Show brief feedback
+            self.count_label.setText("URL copied")
+            QTimer.singleShot(1000, self.update_count)
+    
+    def delete_entry(self, row: int):
+        """Delete a history entry."""
+        entry_id = self.history_model.entry(row).get("id", "")
+        try:
+            HistoryManager.remove_entry(entry_id)
+            self.history_model.remove_row(row)
+            self.update_count()
+            logger.info(f"Deleted history entry: {entry_id}")
+        except Exception as e:
+            logger.error(f"Error deleting entry: {e}")
+            QMessageBox.warning(self, "Error", f"Failed to delete entry: {e}")
+    
+    def redownload_entry(self, row: int):
+        """Redownload an entry."""
+        QMessageBox.information(
+            self,
+            "Redownload",
+            "Redownload feature coming soon!\n\nURL: " + self.history_model.entry(row).get("url", "N/A")
+        )
+
     def clear_all_history(self):
         """Clear all download history."""
         reply = QMessageBox.question(
@@ -8,7 +8,7 @@ import sys
 import threading
 import webbrowser
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 from urllib.parse import urlparse
 
 from PySide6.QtCore import Qt, QTimer, Slot
@@ -38,6 +38,7 @@ from src.core.tiktoksage_utils import (
     load_saved_path,
     save_path,
     validate_tiktok_url,
+    validate_tiktok_urls,
 )
 from src.core.tiktoksage_tiktokapi import check_tiktokapi_binary, setup_tiktokapi
 from src.utils.tiktoksage_constants import ICON_PATH, SUBPROCESS_CREATIONFLAGS
@@ -85,6 +86,12 @@ class TikTokSageApp(QMainWindow):
         # Download queue for channel downloads
         self.download_queue: List[str] = []
         self.current_queue_index = 0
+        self.queue_progress: Dict[int, float] = {}  # Progress per queued video index
+        
+        # Polls the running download's progress (the thread does not signal every chunk)
+        self.progress_timer = QTimer(self)
+        self.progress_timer.setInterval(50)
+        self.progress_timer.timeout.connect(self.poll_download_progress)
         
         # Initialize proxy settings from config
         self.proxy_url = ConfigManager.get("proxy_url")
@@ -449,29 +456,55 @@ class TikTokSageApp(QMainWindow):
             return
         
         self.save_description = self.save_description_checkbox.isChecked()
-        is_audio_only = self.audio_only_checkbox.isChecked()
         
         # Create and start download thread
+        self.start_download_thread([url], path)
+        
+        self.download_btn.setEnabled(False)
+        self.analyze_btn.setEnabled(False)
+        self.pause_btn.setEnabled(True)
+        self.cancel_btn.setEnabled(True)
+        self.progress_bar.setValue(0)
+
+    def start_download_thread(self, urls: List[str], path: str) -> None:
+        """Download urls into path on a single DownloadThread."""
         self.current_download = DownloadThread(
-            url=url,
+            urls=urls,
             path=path,
-            is_audio_only=is_audio_only,
+            is_audio_only=self.audio_only_checkbox.isChecked(),
             proxy_url=self.proxy_url,
             save_description=self.save_description,
         )
         
-        self.current_download.progress_signal.connect(self.update_progress)
+        self.current_download.progress_signal.connect(self.update_download_progress)
         self.current_download.status_signal.connect(self.update_status)
+        self.current_download.item_finished_signal.connect(self.on_download_item_finished)
         self.current_download.finished_signal.connect(self.on_download_finished)
         self.current_download.error_signal.connect(self.on_download_error)
         
         self.current_download.start()
+        self.progress_timer.start()
+
+    def poll_download_progress(self) -> None:
+        """Show the progress the running download made since the last poll."""
+        if not self.current_download:
+            return
+        for index, progress in self.current_download.take_progress().items():
+            self.update_download_progress(index, progress)
+
+    @Slot(int, float)
+    def update_download_progress(self, index: int, progress: float) -> None:
+        """Show the progress of the video at index of the running download."""
+        if not self.download_queue:
+            self.update_progress(progress)
+            return
         
-        self.download_btn.setEnabled(False)
-        self.analyze_btn.setEnabled(False)
-        self.pause_btn.setEnabled(True)
-        self.cancel_btn.setEnabled(True)
-        self.progress_bar.setValue(0)
+        # Queued videos may download in parallel: show their overall progress
+        self.queue_progress[index] = progress
+        self.update_progress(sum(self.queue_progress.values()) / len(self.download_queue))
+        if index != self.current_queue_index:
+            self.current_queue_index = index
+            self.status_label.setText(f"Downloading {index + 1}/{len(self.download_queue)}...")
 
     @Slot(float)
     def update_progress(self, progress: float) -> None:
@@ -518,17 +551,14 @@ class TikTokSageApp(QMainWindow):
         """Handle download cancelled."""
         self.status_label.setText(_("download.cancelled"))
         self.reset_download_controls()
+        self.download_queue = []
+        self.current_queue_index = 0
 
-    @Slot()
-    def on_download_finished(self) -> None:
-        """Handle download finished."""
+    @Slot(int, str)
+    def on_download_item_finished(self, index: int, file_path: str) -> None:
+        """Handle one video of the running download finished."""
         # Add to history
         if self.video_info:
-            # Get the actual downloaded file path from the download thread
-            file_path = None
-            if hasattr(self, 'current_download') and self.current_download:
-                file_path = getattr(self.current_download, 'downloaded_file_path', None)
-            
             HistoryManager.add_entry(
                 title=self.video_info.get("title", "Unknown"),
                 url=self.url_input.text(),
@@ -536,64 +566,44 @@ class TikTokSageApp(QMainWindow):
                 file_path=file_path,
                 is_audio_only=self.audio_only_checkbox.isChecked(),
             )
-        
-        # Check if there are more videos in the queue
-        if self.download_queue and self.current_queue_index < len(self.download_queue) - 1:
-            self.current_queue_index += 1
-            self.download_next_from_queue()
-        else:
-            # Show completion dialog with more details
-            self.show_download_completion_dialog()
-            self.reset_download_controls()
-            self.download_queue = []
-            self.current_queue_index = 0
-
-    def download_next_from_queue(self) -> None:
-        """Download the next video from the queue."""
+
+    @Slot()
+    def on_download_finished(self) -> None:
+        """Handle download finished."""
+        # Show completion dialog with more details
+        self.show_download_completion_dialog()
+        self.reset_download_controls()
+        self.download_queue = []
+        self.current_queue_index = 0
+
+    def download_queue_videos(self) -> None:
+        """Download all queued videos with one download thread."""
         try:
-            if self.current_queue_index >= len(self.download_queue):
-                self.reset_download_controls()
-                self.channel_folder = None
-                return
-            
             # Wait for previous thread to finish if still running
             if self.current_download and self.current_download.isRunning():
                 logger.info("Waiting for previous download to finish...")
                 self.current_download.wait()
             
-            next_url = self.download_queue[self.current_queue_index]
-            
             # Use channel folder if available, otherwise use default path
             if hasattr(self, 'channel_folder') and self.channel_folder:
                 download_path = str(self.channel_folder)
             else:
                 download_path = self.path_input.text().strip()
             
-            self.status_label.setText(f"Downloading {self.current_queue_index + 1}/{len(self.download_queue)}...")
-            
-            # Download next video
-            is_audio_only = self.audio_only_checkbox.isChecked()
-            
-            self.current_download = DownloadThread(
-                url=next_url,
-                path=download_path,
-                is_audio_only=is_audio_only,
-                proxy_url=self.proxy_url,
-                save_description=self.save_description,
-            )
-            
-            self.current_download.progress_signal.connect(self.update_progress)
-            self.current_download.status_signal.connect(self.update_status)
-            self.current_download.finished_signal.connect(self.on_download_finished)
-            self.current_download.error_signal.connect(self.on_download_error)
-            
-            self.current_download.start()
+            self.queue_progress = {}
+            self.status_label.setText(f"Downloading 1/{len(self.download_queue)}...")
+            self.start_download_thread(self.download_queue, download_path)
         except Exception as e:
-            logger.error(f"Error in download_next_from_queue: {e}")
+            logger.error(f"Error in download_queue_videos: {e}")
             self.on_download_error(str(e))
     
     def queue_downloads(self, urls: List[str], channel_name: str = None) -> None:
         """Queue multiple videos for download."""
+        # Channel listings can be thousands of URLs: validate them in one batch
+        valid = validate_tiktok_urls(urls)
+        if not all(valid):
+            logger.warning(f"Skipping {valid.count(False)} invalid TikTok URLs")
+            urls = [url for url, ok in zip(urls, valid) if ok]
         if not urls:
             return
         
@@ -618,8 +628,8 @@ class TikTokSageApp(QMainWindow):
         
         self.show_toast(f"Queued {len(urls)} videos. Starting download...")
         
-        # Start downloading first video
-        self.download_next_from_queue()
+        # Start downloading the queued videos
+        self.download_queue_videos()
 
     def show_toast(self, text: str, timeout: int = 2500) -> None:
         """Show a small transient toast message inside the app without an icon."""
@@ -679,18 +689,12 @@ class TikTokSageApp(QMainWindow):
 
     @Slot(str)
     def on_download_error(self, error: str) -> None:
-        """Handle download error."""
-        # Log the error but continue with next video if in queue
+        """Handle download error (the download thread skips failed queued videos itself)."""
         logger.error(f"Download error: {error}")
-        
-        if self.download_queue and self.current_queue_index < len(self.download_queue) - 1:
-            # Skip this video and continue with next
-            self.current_queue_index += 1
-            self.download_next_from_queue()
-        else:
-            # No more videos in queue, stop and show error
-            QMessageBox.critical(self, _("dialogs.error"), f"Download Error: {error}")
-            self.reset_download_controls()
+        QMessageBox.critical(self, _("dialogs.error"), f"Download Error: {error}")
+        self.reset_download_controls()
+        self.download_queue = []
+        self.current_queue_index = 0
 
     def on_channel_loading_progress(self, message: str) -> None:
         """Handle channel loading progress updates."""
@@ -716,6 +720,7 @@ class TikTokSageApp(QMainWindow):
 
     def reset_download_controls(self) -> None:
         """Reset download control states."""
+        self.progress_timer.stop()
         self.download_btn.setEnabled(True)
         self.analyze_btn.setEnabled(True)
         self.pause_btn.setEnabled(False)
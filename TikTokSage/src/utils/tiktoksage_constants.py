@@ -90,6 +90,7 @@ if OS_NAME == "Windows":
     APP_CONFIG_FILE: Path = APP_DATA_DIR / "tiktoksage_config.json"
     APP_HISTORY_FILE: Path = APP_DATA_DIR / "tiktoksage_history.json"
     APP_THUMBNAILS_DIR: Path = APP_DATA_DIR / "thumbnails"
+    APP_CHANNEL_CACHE_DIR: Path = APP_DATA_DIR / "channels"
 
     SUBPROCESS_CREATIONFLAGS: int = subprocess.CREATE_NO_WINDOW
 
@@ -105,6 +106,7 @@ elif OS_NAME == "Darwin":  # macOS
     APP_CONFIG_FILE: Path = APP_DATA_DIR / "tiktoksage_config.json"
     APP_HISTORY_FILE: Path = APP_DATA_DIR / "tiktoksage_history.json"
     APP_THUMBNAILS_DIR: Path = APP_DATA_DIR / "thumbnails"
+    APP_CHANNEL_CACHE_DIR: Path = APP_DATA_DIR / "channels"
 
     SUBPROCESS_CREATIONFLAGS: int = 0
 
@@ -119,6 +121,7 @@ else:  # Linux and other UNIX-like
     APP_CONFIG_FILE: Path = APP_DATA_DIR / "tiktoksage_config.json"
     APP_HISTORY_FILE: Path = APP_DATA_DIR / "tiktoksage_history.json"
     APP_THUMBNAILS_DIR: Path = APP_DATA_DIR / "thumbnails"
+    APP_CHANNEL_CACHE_DIR: Path = APP_DATA_DIR / "channels"
 
     SUBPROCESS_CREATIONFLAGS: int = 0
 
@@ -143,3 +146,4 @@ else:
     APP_DATA_DIR.mkdir(parents=True, exist_ok=True)
     APP_LOG_DIR.mkdir(parents=True, exist_ok=True)
     APP_THUMBNAILS_DIR.mkdir(parents=True, exist_ok=True)
+    APP_CHANNEL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
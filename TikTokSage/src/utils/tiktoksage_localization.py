@@ -48,6 +48,9 @@ class LocalizationManager:
     _languages: Dict[str, Dict[str, Any]] = {}
     _languages_dir = Path(__file__).parent.parent.parent / "languages"
     
+    # Resolved (unformatted) strings of the current language, by key
+    _resolved: Dict[str, str] = {}
+    
     # Fallback English strings embedded in code
     _fallback_strings = {
         "app": {
@@ -107,6 +110,7 @@ class LocalizationManager:
         with cls._lock:
             cls._current_language = language
             cls._load_language(language)
+            cls._resolved = {}
     
     @classmethod
     def _load_language(cls, language: str) -> None:
@@ -140,6 +144,23 @@ class LocalizationManager:
         Returns:
             Localized string or fallback English string
         """
+        # Repeated lookups (status messages emitted on every download) are served
+        # from the cache without taking the lock or walking the nested keys
+        text = cls._resolved.get(key)
+        if text is None:
+            text = cls._resolve(key)
+        
+        # Format string if needed
+        if kwargs:
+            try:
+                return text.format(**kwargs)
+            except KeyError as e:
+                logger.warning(f"Missing format argument for key {key}: {e}")
+        return text
+    
+    @classmethod
+    def _resolve(cls, key: str) -> str:
+        """Look up key in the current language (or the fallback) and cache the result."""
         with cls._lock:
             # Ensure current language is loaded
             if cls._current_language not in cls._languages:
@@ -169,20 +190,13 @@ class LocalizationManager:
                         value = None
                         break
             
-            # Return the value or the original key if not found
+            # Use the value or the original key if not found
             if value is None:
                 logger.warning(f"Missing translation key: {key}")
-                return key
-            
-            # Format string if needed
-            if isinstance(value, str) and kwargs:
-                try:
-                    return value.format(**kwargs)
-                except KeyError as e:
-                    logger.warning(f"Missing format argument for key {key}: {e}")
-                    return value
+            text = value if isinstance(value, str) else key
             
-            return value if isinstance(value, str) else key
+            cls._resolved[key] = text
+            return text
     
     @classmethod
     def set_language(cls, language: str) -> None:
@@ -190,6 +204,7 @@ class LocalizationManager:
         with cls._lock:
             cls._current_language = language
             cls._load_language(language)
+            cls._resolved = {}
     
     @classmethod
     def get_current_language(cls) -> str: